@@ -7,7 +7,7 @@ Converts MCP tools into domain-specific Python APIs that agents can compose into
 
 from .framework import MCPApi
 from .connector import MCPConnector
-from .runtime import MCPRuntime, mcp_call
+from .runtime import MCPRuntime, mcp_call, mcp_call_many
 from .skill_manager import SkillManager
 from .telemetry import TelemetryLogger
 from .database import SkillsDatabase
@@ -19,6 +19,7 @@ __all__ = [
     "MCPConnector",
     "MCPRuntime",
     "mcp_call",
+    "mcp_call_many",
     "SkillManager",
     "TelemetryLogger",
     "SkillsDatabase",
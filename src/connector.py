@@ -2,7 +2,7 @@
 MCP Connector - Connects to MCP servers and generates Python APIs.
 """
 
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Coroutine, Tuple
 from pathlib import Path
 import logging
 import asyncio
@@ -11,6 +11,8 @@ from contextlib import AsyncExitStack
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from .runtime import AsyncLoopThread
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +49,12 @@ class MCPConnector:
         self.connections: Dict[str, ClientSession] = {}
         self.exit_stack: Optional[AsyncExitStack] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_event_loop = False
+        self._loop_thread: Optional[AsyncLoopThread] = None
+        self._connection_task: Optional[asyncio.Task] = None
+        self._disconnect_event: Optional[asyncio.Event] = None
+        # (name, command, args, env) -> tool schemas from the last introspection
+        self._schema_cache: Dict[Tuple, List[ToolSchema]] = {}
 
     def add_server(self, name: str, command: str, env: Optional[Dict[str, str]] = None) -> None:
         """
@@ -66,27 +74,99 @@ class MCPConnector:
         }
         logger.info(f"Registered MCP server: {name}")
 
-    def connect_all(self) -> None:
+    def connect_all(self, loop_thread: Optional[AsyncLoopThread] = None) -> None:
         """
         Connect to all registered MCP servers.
+
+        Args:
+            loop_thread: Optional loop thread to open the sessions on.
+                Pass the runtime's loop thread so that MCPRuntime can call
+                the sessions from any thread. Without it, the connector
+                drives a private event loop from the calling thread until
+                disconnect_all().
         """
         logger.info("Connecting to MCP servers...")
 
-        # Get or create event loop
-        try:
-            self._event_loop = asyncio.get_event_loop()
-        except RuntimeError:
+        if loop_thread is not None:
+            self._loop_thread = loop_thread
+        elif self._event_loop is None:
+            # Explicit loop handle: the sessions stay bound to this loop
             self._event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._event_loop)
+            self._owns_event_loop = True
 
         # Run async connection
-        self._event_loop.run_until_complete(self._async_connect_all())
+        self._run(self._async_open_connections())
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine on the loop the sessions live on.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Coroutine result
+        """
+        if self._loop_thread is not None:
+            return self._loop_thread.run(coro)
+
+        if self._event_loop is None:
+            coro.close()
+            raise RuntimeError("Event loop not initialized")
+
+        return self._event_loop.run_until_complete(coro)
+
+    async def _async_open_connections(self) -> None:
+        """
+        Connect all servers inside a task that owns them until disconnect.
+
+        The stdio transports are anyio contexts that must be exited by the
+        task that entered them, so one long-lived task enters them, waits
+        for disconnect_all() and then exits them.
+        """
+        connected = asyncio.get_running_loop().create_future()
+        self._disconnect_event = asyncio.Event()
+        self._connection_task = asyncio.create_task(
+            self._async_hold_connections(connected)
+        )
+        await connected
+
+    async def _async_hold_connections(self, connected: asyncio.Future) -> None:
+        """Connection owner task: connect, wait for disconnect, clean up."""
+        try:
+            await self._async_connect_all()
+        except Exception as e:
+            await self._async_disconnect_all()
+            connected.set_exception(e)
+            return
+
+        connected.set_result(None)
+        disconnect_event = self._disconnect_event
+        assert disconnect_event is not None
+        await disconnect_event.wait()
+        await self._async_disconnect_all()
+
+    async def _async_close_connections(self) -> None:
+        """Signal the connection owner task and wait for it to clean up."""
+        disconnect_event = self._disconnect_event
+        connection_task = self._connection_task
+        assert disconnect_event is not None and connection_task is not None
+        disconnect_event.set()
+        await connection_task
 
     async def _async_connect_all(self) -> None:
-        """Async implementation of connect_all."""
+        """
+        Async implementation of connect_all.
+
+        Server processes are spawned one after another because their
+        transports must be entered on this task's exit stack. The MCP
+        handshakes then run concurrently, so startup costs the slowest
+        server's handshake rather than the sum of all of them.
+        """
         self.exit_stack = AsyncExitStack()
         await self.exit_stack.__aenter__()
 
+        sessions: Dict[str, ClientSession] = {}
         for server_name, server_config in self.servers.items():
             try:
                 logger.info(f"Connecting to {server_name}...")
@@ -105,33 +185,64 @@ class MCPConnector:
                 read_stream, write_stream = stdio_transport
 
                 # Create session
-                session = await self.exit_stack.enter_async_context(
+                sessions[server_name] = await self.exit_stack.enter_async_context(
                     ClientSession(read_stream, write_stream)
                 )
 
-                # Initialize session
-                await session.initialize()
-
-                self.connections[server_name] = session
-                logger.info(f"Connected to {server_name}")
-
             except Exception as e:
                 logger.error(f"Failed to connect to {server_name}: {e}")
                 raise
 
+        # Initialize all sessions concurrently. If one fails, cancel and reap
+        # the rest before the exit stack tears their transports down
+        tasks = [
+            asyncio.create_task(self._async_initialize_session(server_name, session))
+            for server_name, session in sessions.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _async_initialize_session(
+        self,
+        server_name: str,
+        session: ClientSession
+    ) -> None:
+        """Run the MCP handshake for one server and register its session."""
+        try:
+            await session.initialize()
+        except Exception as e:
+            logger.error(f"Failed to connect to {server_name}: {e}")
+            raise
+
+        self.connections[server_name] = session
+        logger.info(f"Connected to {server_name}")
+
     def disconnect_all(self) -> None:
         """
         Disconnect from all MCP servers.
         """
         logger.info("Disconnecting from MCP servers...")
 
-        if self.exit_stack and self._event_loop:
-            self._event_loop.run_until_complete(
-                self.exit_stack.__aexit__(None, None, None)
-            )
+        if self._connection_task is not None:
+            self._run(self._async_close_connections())
+        elif self.exit_stack:
+            self._run(self._async_disconnect_all())
 
         self.connections.clear()
         self.exit_stack = None
+        self._connection_task = None
+        self._disconnect_event = None
+        self._loop_thread = None
+
+        if self._owns_event_loop and self._event_loop is not None:
+            self._event_loop.close()
+            self._event_loop = None
+            self._owns_event_loop = False
 
     def get_connections(self) -> Dict[str, ClientSession]:
         """
@@ -227,9 +338,10 @@ class MCPConnector:
         session = self.connections[server_name]
 
         # Run async introspection
-        return self._event_loop.run_until_complete(
+        tool_schemas: List[ToolSchema] = self._run(
             self._async_introspect_server(server_name, session)
         )
+        return tool_schemas
 
     async def _async_introspect_server(
         self,
@@ -270,59 +382,106 @@ class MCPConnector:
         logger.info(f"Found {len(tool_schemas)} tools in {server_name}")
         return tool_schemas
 
-    def generate_apis_once(self, output_dir: Path) -> None:
+    def generate_apis_once(self, output_dir: Path, refresh: bool = False) -> None:
         """
         Connect, generate APIs, and disconnect in one async flow.
 
         This method handles the entire code generation lifecycle properly
-        without nested event loop issues.
+        without nested event loop issues. If every registered server was
+        already introspected by this connector with the same command and
+        environment, the cached schemas are used and no server is started.
 
         Args:
             output_dir: Directory to write generated APIs
+            refresh: Re-introspect servers even if schemas are cached
         """
-        # Get or create event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        # Run the whole flow in one async context
-        loop.run_until_complete(self._async_generate_apis_once(output_dir))
+        # Run the whole flow in one async context on a fresh loop
+        asyncio.run(self._async_generate_apis_once(output_dir, refresh))
 
-    async def _async_generate_apis_once(self, output_dir: Path) -> None:
+    async def _async_generate_apis_once(self, output_dir: Path, refresh: bool = False) -> None:
         """Async implementation of generate_apis_once."""
         logger.info(f"Generating APIs to {output_dir}")
 
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        cached: Dict[str, List[ToolSchema]] = {}
+        for name in self.servers:
+            schemas = self._schema_cache.get(self._schema_cache_key(name))
+            if schemas is not None:
+                cached[name] = schemas
+        if not refresh and cached and len(cached) == len(self.servers):
+            logger.info("Using cached tool schemas, skipping server connections")
+            for server_name, tool_schemas in cached.items():
+                self._write_server_apis(output_dir, server_name, tool_schemas)
+            logger.info("API generation complete")
+            return
+
         # Connect to all servers temporarily
         await self._async_connect_all()
 
         try:
-            # Generate APIs for each connected server
-            for server_name, session in self.connections.items():
-                logger.info(f"Generating APIs for {server_name}...")
-
-                # Introspect server (async, no nested event loop)
-                tool_schemas = await self._async_introspect_server(server_name, session)
-
-                # Create server directory
-                server_dir = output_dir / server_name
-                server_dir.mkdir(parents=True, exist_ok=True)
-
-                # Generate API for each tool
-                for tool in tool_schemas:
-                    self._generate_api_files(tool, server_dir)
+            # Introspect all servers concurrently (async, no nested event loop)
+            server_names = list(self.connections.keys())
+            all_schemas = await asyncio.gather(*(
+                self._async_introspect_server(server_name, self.connections[server_name])
+                for server_name in server_names
+            ))
 
-                logger.info(f"Generated {len(tool_schemas)} APIs for {server_name}")
+            # Generate APIs for each connected server
+            for server_name, tool_schemas in zip(server_names, all_schemas):
+                self._schema_cache[self._schema_cache_key(server_name)] = tool_schemas
+                self._write_server_apis(output_dir, server_name, tool_schemas)
         finally:
             # Disconnect (async, no nested event loop)
             await self._async_disconnect_all()
 
         logger.info("API generation complete")
 
+    def _schema_cache_key(self, server_name: str) -> Tuple:
+        """
+        Build the schema cache key for a registered server.
+
+        Args:
+            server_name: Name of the server
+
+        Returns:
+            Tuple of name, command, args and sorted env items
+        """
+        config = self.servers.get(server_name, {})
+        return (
+            server_name,
+            config.get("command"),
+            tuple(config.get("args", [])),
+            tuple(sorted(config.get("env", {}).items())),
+        )
+
+    def _write_server_apis(
+        self,
+        output_dir: Path,
+        server_name: str,
+        tool_schemas: List[ToolSchema],
+    ) -> None:
+        """
+        Write generated API files for every tool of one server.
+
+        Args:
+            output_dir: Directory to write generated APIs
+            server_name: Name of the server
+            tool_schemas: Tool schemas of the server
+        """
+        logger.info(f"Generating APIs for {server_name}...")
+
+        # Create server directory
+        server_dir = output_dir / server_name
+        server_dir.mkdir(parents=True, exist_ok=True)
+
+        # Generate API for each tool
+        for tool in tool_schemas:
+            self._generate_api_files(tool, server_dir)
+
+        logger.info(f"Generated {len(tool_schemas)} APIs for {server_name}")
+
     async def _async_disconnect_all(self) -> None:
         """Async implementation of disconnect."""
         if self.exit_stack:
@@ -342,8 +501,6 @@ class MCPConnector:
         Args:
             output_dir: Directory to write generated APIs
         """
-        from .templates import generate_main_py, generate_readme_md, generate_init_py
-
         logger.info(f"Generating APIs to {output_dir}")
 
         # Ensure output directory exists
@@ -351,20 +508,12 @@ class MCPConnector:
 
         # Generate APIs for each server
         for server_name in self.connections.keys():
-            logger.info(f"Generating APIs for {server_name}...")
-
-            # Introspect server
+            # Introspect server over its live session
             tool_schemas = self.introspect_server(server_name)
+            if server_name in self.servers:
+                self._schema_cache[self._schema_cache_key(server_name)] = tool_schemas
 
-            # Create server directory
-            server_dir = output_dir / server_name
-            server_dir.mkdir(parents=True, exist_ok=True)
-
-            # Generate API for each tool
-            for tool in tool_schemas:
-                self._generate_api_files(tool, server_dir)
-
-            logger.info(f"Generated {len(tool_schemas)} APIs for {server_name}")
+            self._write_server_apis(output_dir, server_name, tool_schemas)
 
         logger.info("API generation complete")
 
@@ -380,7 +529,7 @@ class MCPConnector:
             tool: Tool schema
             server_dir: Server directory path
         """
-        from .templates import generate_main_py, generate_readme_md, generate_init_py
+        from .templates import generate_main_py_to, generate_readme_md_to, generate_init_py
 
         # Create tool directory: servers/{server_name}/{tool_name}/
         tool_dir = server_dir / tool.name
@@ -388,14 +537,14 @@ class MCPConnector:
 
         # Generate main.py
         main_py_path = tool_dir / "main.py"
-        main_py_content = generate_main_py(tool)
-        main_py_path.write_text(main_py_content)
+        with open(main_py_path, "w") as fp:
+            generate_main_py_to(tool, fp)
         logger.debug(f"Generated {main_py_path}")
 
         # Generate README.md
         readme_path = tool_dir / "README.md"
-        readme_content = generate_readme_md(tool)
-        readme_path.write_text(readme_content)
+        with open(readme_path, "w") as fp:
+            generate_readme_md_to(tool, fp)
         logger.debug(f"Generated {readme_path}")
 
         # Generate __init__.py
@@ -8,12 +8,15 @@ agent skills across sessions.
 import aiosqlite
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per cursor round-trip when streaming skills
+_FETCH_BATCH_SIZE = 256
+
 
 class SkillsDatabase:
     """
@@ -93,19 +96,60 @@ class SkillsDatabase:
             ) as cursor:
                 rows = await cursor.fetchall()
 
-        skills = []
-        for row in rows:
-            skill = dict(row)
-            # Parse JSON fields
-            if skill.get('dependencies'):
-                skill['dependencies'] = json.loads(skill['dependencies'])
-            if skill.get('metadata'):
-                skill['metadata'] = json.loads(skill['metadata'])
-            skills.append(skill)
+        skills = [self._row_to_skill(row) for row in rows]
 
         logger.info(f"Retrieved {len(skills)} skills for agent '{agent_name}'")
         return skills
 
+    async def iter_all_skills(
+        self,
+        agent_name: str,
+        batch_size: int = _FETCH_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all skills for an agent without loading them all at once.
+
+        Rows are fetched from the cursor in windows of batch_size, so peak
+        memory is bounded by the window rather than the whole result set.
+
+        Args:
+            agent_name: Agent identifier
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            Skill dictionaries, ordered by category and name
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute(
+                "SELECT * FROM skills WHERE agent_name = ? ORDER BY category, skill_name",
+                (agent_name,)
+            ) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._row_to_skill(row)
+
+    @staticmethod
+    def _row_to_skill(row: aiosqlite.Row) -> Dict[str, Any]:
+        """
+        Convert a skills row to a dict, parsing its JSON fields.
+
+        Args:
+            row: Row from the skills table
+
+        Returns:
+            Skill dictionary
+        """
+        skill = dict(row)
+        if skill.get('dependencies'):
+            skill['dependencies'] = json.loads(skill['dependencies'])
+        if skill.get('metadata'):
+            skill['metadata'] = json.loads(skill['metadata'])
+        return skill
+
     async def get_skill(
         self,
         agent_name: str,
@@ -132,14 +176,7 @@ class SkillsDatabase:
         if not row:
             return None
 
-        skill = dict(row)
-        # Parse JSON fields
-        if skill.get('dependencies'):
-            skill['dependencies'] = json.loads(skill['dependencies'])
-        if skill.get('metadata'):
-            skill['metadata'] = json.loads(skill['metadata'])
-
-        return skill
+        return self._row_to_skill(row)
 
     async def save_skill(
         self,
@@ -208,6 +245,56 @@ class SkillsDatabase:
 
             await db.commit()
 
+    async def save_skills(
+        self,
+        agent_name: str,
+        skills: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Save or update several skills in a single transaction.
+
+        Args:
+            agent_name: Agent identifier
+            skills: Skill dicts with 'name', 'category', 'code' and optional
+                'dependencies' and 'metadata' keys
+        """
+        if not skills:
+            return
+
+        now = datetime.utcnow().isoformat() + 'Z'
+
+        rows = [
+            (
+                agent_name,
+                skill['name'],
+                skill['category'],
+                skill['code'],
+                now,
+                now,
+                json.dumps(skill['dependencies']) if skill.get('dependencies') else None,
+                json.dumps(skill['metadata']) if skill.get('metadata') else None,
+            )
+            for skill in skills
+        ]
+
+        async with aiosqlite.connect(self.db_path) as db:
+            # Upsert keeps the original created_at of existing skills
+            await db.executemany("""
+                INSERT INTO skills (
+                    agent_name, skill_name, category, code,
+                    created_at, updated_at, dependencies, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(agent_name, skill_name) DO UPDATE SET
+                    category = excluded.category,
+                    code = excluded.code,
+                    updated_at = excluded.updated_at,
+                    dependencies = excluded.dependencies,
+                    metadata = excluded.metadata
+            """, rows)
+            await db.commit()
+
+        logger.info(f"Saved {len(rows)} skills for agent '{agent_name}'")
+
     async def delete_skill(self, agent_name: str, skill_name: str) -> bool:
         """
         Delete a skill.
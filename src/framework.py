@@ -8,6 +8,7 @@ The agent runs in its own environment and uses the generated libraries.
 from typing import Optional, Dict, Any
 from pathlib import Path
 import asyncio
+import threading
 
 from .connector import MCPConnector
 from .runtime import MCPRuntime
@@ -34,6 +35,7 @@ class MCPApi:
         skills_dir: str = "skills",
         skills_db: str = "skills.db",
         telemetry_db: Optional[str] = ".mcp_telemetry/telemetry.db",
+        telemetry_pragmas: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize the API.
@@ -44,6 +46,8 @@ class MCPApi:
             skills_dir: Directory where agent skills are stored
             skills_db: Path to skills database
             telemetry_db: Path to telemetry database (None to disable)
+            telemetry_pragmas: Extra SQLite PRAGMAs for the telemetry database,
+                overriding the defaults (e.g. {"synchronous": "OFF"} in tests)
         """
         self.agent_name = agent_name
         self.servers_dir = Path(servers_dir)
@@ -58,7 +62,7 @@ class MCPApi:
         self.telemetry = None
         if telemetry_db:
             telemetry_path = Path(telemetry_db)
-            self.telemetry = TelemetryLogger(telemetry_path)
+            self.telemetry = TelemetryLogger(telemetry_path, pragmas=telemetry_pragmas)
 
         # Initialize components
         self.connector = MCPConnector()
@@ -71,6 +75,8 @@ class MCPApi:
         )
 
         self._started = False
+        # Serializes start/stop/generate so concurrent callers coalesce
+        self._lifecycle_lock = threading.Lock()
 
     def add_mcp_server(
         self,
@@ -88,7 +94,7 @@ class MCPApi:
         """
         self.connector.add_server(name, command, env)
 
-    def generate_libraries(self) -> None:
+    def generate_libraries(self, refresh: bool = False) -> None:
         """
         Generate Python libraries from all registered MCP servers.
 
@@ -98,9 +104,23 @@ class MCPApi:
         - servers/{server_name}/{tool_name}/__init__.py
 
         This is a one-time codegen step. Commit the generated code to git.
+        If the runtime is started, its live sessions are reused instead of
+        spawning the servers again. Otherwise tool schemas cached by an
+        earlier run are reused without spawning any servers; pass
+        refresh=True after a server's tools change to introspect it again.
+
+        Args:
+            refresh: Re-introspect servers even if cached schemas exist.
+                Live sessions are always introspected.
         """
-        # Use the all-in-one method to avoid nested event loop issues
-        self.connector.generate_apis_once(output_dir=self.servers_dir)
+        with self._lifecycle_lock:
+            if self._started:
+                self.connector.generate_apis(output_dir=self.servers_dir)
+            else:
+                # Use the all-in-one method to avoid nested event loop issues
+                self.connector.generate_apis_once(
+                    output_dir=self.servers_dir, refresh=refresh
+                )
 
     async def hydrate_skills(self) -> int:
         """
@@ -124,25 +144,34 @@ class MCPApi:
         The runtime is needed for the generated server libraries to work.
         Call this when your agent starts up, after hydrating skills.
         """
-        if self._started:
-            return
+        with self._lifecycle_lock:
+            if self._started:
+                return
 
-        self.connector.connect_all()
-        self.runtime.register_servers(self.connector.get_connections())
-        self._started = True
+            # Sessions are opened on the runtime's loop thread so calls can be
+            # dispatched to them from any agent thread
+            self.connector.connect_all(loop_thread=self.runtime.loop_thread)
+            self.runtime.register_servers(self.connector.get_connections())
+            self._started = True
 
     def stop(self) -> None:
         """
         Stop the runtime (disconnect from MCP servers).
 
-        Call this when your agent shuts down.
+        Call this when your agent shuts down. Waits for skills queued for
+        database persistence and pending telemetry events to be written.
         """
-        if not self._started:
-            return
+        self.skill_manager.flush()
+        if self.telemetry:
+            self.telemetry.flush()
 
-        self.connector.disconnect_all()
-        self.runtime.clear()
-        self._started = False
+        with self._lifecycle_lock:
+            if not self._started:
+                return
+
+            self.connector.disconnect_all()
+            self.runtime.clear()
+            self._started = False
 
     def save_skill(
         self,
@@ -191,6 +220,26 @@ class MCPApi:
             persist_to_db=persist_to_db
         )
 
+    def save_skills(self, skills: list, persist_to_db: bool = True) -> None:
+        """
+        Save several skills at once.
+
+        Cheaper than calling save_skill() in a loop: files are written in
+        parallel and telemetry records one event for the batch.
+
+        Args:
+            skills: Dicts with 'code' and 'name', plus optional 'category'
+                and 'tags' (same meaning as the save_skill() arguments)
+            persist_to_db: Whether to persist to database (default True)
+
+        Example:
+            api.save_skills([
+                {"code": sync_code, "name": "sync_files", "category": "data_sync"},
+                {"code": report_code, "name": "weekly_report", "tags": ["reports"]},
+            ])
+        """
+        self.skill_manager.save_skills(skills, persist_to_db=persist_to_db)
+
     def list_skills(self, category: Optional[str] = None) -> list:
         """
         List available skills from filesystem.
@@ -296,7 +345,8 @@ class MCPApi:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager support - stops runtime and closes telemetry."""
+        """Context manager support - stops runtime, skill persistence and telemetry."""
         self.stop()
+        self.skill_manager.close()
         if self.telemetry:
             self.telemetry.close()
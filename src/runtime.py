@@ -2,19 +2,37 @@
 MCP Runtime - Executes MCP calls from generated APIs.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Coroutine, List, Tuple
 import logging
 import asyncio
+import threading
 import time
+from contextvars import ContextVar
 
 from mcp import ClientSession
 
+try:
+    import uvloop  # type: ignore[import-not-found]
+except ImportError:  # Optional speedup; not available on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
-# Global runtime instance
+# Runtime for the current context. asyncio tasks inherit it, so agents
+# built in separate tasks each route mcp_call() to their own runtime.
+_runtime_var: ContextVar[Optional["MCPRuntime"]] = ContextVar("mcp_runtime", default=None)
+
+# Most recently created runtime, used where the context has none
+# (e.g. worker threads, which start with an empty context)
 _runtime_instance: Optional["MCPRuntime"] = None
 
 
+def _current_runtime() -> Optional["MCPRuntime"]:
+    """Get the runtime for the current context, else the process-wide one."""
+    runtime = _runtime_var.get()
+    return runtime if runtime is not None else _runtime_instance
+
+
 def mcp_call(server: str, tool: str, params: Dict[str, Any]) -> Any:
     """
     Execute an MCP tool call.
@@ -34,10 +52,89 @@ def mcp_call(server: str, tool: str, params: Dict[str, Any]) -> Any:
         RuntimeError: If runtime not initialized
         Exception: If MCP call fails
     """
-    if _runtime_instance is None:
+    runtime = _current_runtime()
+    if runtime is None:
         raise RuntimeError("MCP Runtime not initialized")
 
-    return _runtime_instance.call(server, tool, params)
+    return runtime.call(server, tool, params)
+
+
+def mcp_call_many(calls: List[Tuple[str, str, Dict[str, Any]]]) -> List[Any]:
+    """
+    Execute several independent MCP tool calls concurrently.
+
+    Total latency is that of the slowest call rather than the sum of all
+    of them.
+
+    Args:
+        calls: List of (server, tool, params) tuples
+
+    Returns:
+        Results in the same order as calls. A call that failed has its
+        exception in its slot instead of a result.
+
+    Raises:
+        RuntimeError: If runtime not initialized
+        ValueError: If any server is not registered
+    """
+    runtime = _current_runtime()
+    if runtime is None:
+        raise RuntimeError("MCP Runtime not initialized")
+
+    return runtime.call_many(calls)
+
+
+class AsyncLoopThread:
+    """
+    Event loop running forever on a dedicated daemon thread.
+
+    MCP sessions live on this loop, and synchronous callers on any thread
+    dispatch coroutines to it with run_coroutine_threadsafe. Calls from
+    different threads can therefore be in flight at the same time, and
+    mcp_call() works even from a thread whose own loop is already running.
+
+    Uses a uvloop loop when uvloop is installed, and the stock asyncio loop
+    otherwise. Tasks are created eagerly where asyncio supports it.
+    """
+
+    def __init__(self, loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None):
+        if loop_factory is None:
+            loop_factory = uvloop.new_event_loop if uvloop else asyncio.new_event_loop
+        self.loop = loop_factory()
+        # Coroutines that finish without suspending (validation errors,
+        # short-circuited calls) skip a scheduling round-trip (3.12+)
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            self.loop.set_task_factory(eager_task_factory)
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="mcp-runtime-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        """Thread target: run the loop until stop() is called."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine on the loop thread and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self) -> None:
+        """Stop the loop, join the thread and close the loop."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
 
 
 class MCPRuntime:
@@ -46,37 +143,46 @@ class MCPRuntime:
 
     This component:
     1. Maintains connections to MCP servers
-    2. Routes mcp_call() to the correct server
+    2. Routes mcp_call() and mcp_call_many() to the correct server
     3. Handles MCP protocol details
     4. Logs telemetry for all MCP calls
     """
 
     def __init__(self, telemetry=None):
         self.servers: Dict[str, ClientSession] = {}
+        self._loop_thread: Optional[AsyncLoopThread] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
         self.telemetry = telemetry
         self._setup_global_instance()
 
     def _setup_global_instance(self) -> None:
-        """Set this as the global runtime instance."""
+        """Set this as the runtime for the current context and the process."""
         global _runtime_instance
+        _runtime_var.set(self)
         _runtime_instance = self
 
+    @property
+    def loop_thread(self) -> AsyncLoopThread:
+        """
+        Loop thread that MCP sessions must be opened on.
+
+        Started on first access and stopped by clear().
+        """
+        if self._loop_thread is None:
+            self._loop_thread = AsyncLoopThread()
+        return self._loop_thread
+
     def register_servers(self, connections: Dict[str, ClientSession]) -> None:
         """
         Register MCP server connections.
 
+        The sessions must have been opened on this runtime's loop_thread.
+
         Args:
             connections: Dict mapping server names to ClientSession objects
         """
         self.servers = connections
-
-        # Get or create event loop
-        try:
-            self._event_loop = asyncio.get_event_loop()
-        except RuntimeError:
-            self._event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._event_loop)
+        self._event_loop = self.loop_thread.loop
 
         logger.info(f"Registered {len(connections)} MCP servers")
 
@@ -111,9 +217,10 @@ class MCPRuntime:
         success = False
 
         try:
-            result = self._event_loop.run_until_complete(
-                self._async_call(server, tool, params)
-            )
+            result = asyncio.run_coroutine_threadsafe(
+                self._async_call(server, tool, params),
+                self._event_loop
+            ).result()
             success = True
             return result
 
@@ -123,18 +230,110 @@ class MCPRuntime:
 
         finally:
             duration_ms = (time.time() - start_time) * 1000
+            self._log_call(server, tool, params, success, duration_ms, result, error)
+
+    def call_many(self, calls: List[Tuple[str, str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Execute several MCP tool calls concurrently on the loop thread.
+
+        Args:
+            calls: List of (server, tool, params) tuples
+
+        Returns:
+            Results in input order, with the exception in place of the
+            result for any call that failed
+
+        Raises:
+            ValueError: If any server not registered
+        """
+        logger.debug(f"MCP call batch: {len(calls)} calls")
 
-            # Log telemetry
-            if self.telemetry:
-                self.telemetry.log_mcp_call(
-                    server=server,
-                    tool=tool,
-                    params=params,
-                    success=success,
-                    duration_ms=duration_ms,
-                    result=result,
-                    error=error,
-                )
+        for server, _, _ in calls:
+            if server not in self.servers:
+                raise ValueError(f"Server '{server}' not registered in runtime")
+
+        if not self._event_loop:
+            raise RuntimeError("Event loop not initialized")
+
+        return asyncio.run_coroutine_threadsafe(
+            self._async_call_many(calls),
+            self._event_loop
+        ).result()
+
+    async def _async_call_many(
+        self,
+        calls: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """
+        Async implementation of call_many.
+
+        Args:
+            calls: List of (server, tool, params) tuples
+
+        Returns:
+            Results or exceptions in input order
+        """
+        return await asyncio.gather(
+            *(self._async_timed_call(server, tool, params) for server, tool, params in calls),
+            return_exceptions=True
+        )
+
+    async def _async_timed_call(
+        self,
+        server: str,
+        tool: str,
+        params: Dict[str, Any]
+    ) -> Any:
+        """
+        Run one call of a batch and log its telemetry.
+
+        Args:
+            server: Server name
+            tool: Tool name
+            params: Tool parameters
+
+        Returns:
+            Tool execution result
+        """
+        start_time = time.time()
+        error = None
+        result = None
+        success = False
+
+        try:
+            result = await self._async_call(server, tool, params)
+            success = True
+            return result
+
+        except Exception as e:
+            error = e
+            raise
+
+        finally:
+            duration_ms = (time.time() - start_time) * 1000
+            self._log_call(server, tool, params, success, duration_ms, result, error)
+
+    def _log_call(
+        self,
+        server: str,
+        tool: str,
+        params: Dict[str, Any],
+        success: bool,
+        duration_ms: float,
+        result: Any,
+        error: Optional[Exception],
+    ) -> None:
+        """Log telemetry for one MCP call."""
+        if self.telemetry:
+            self.telemetry.log_mcp_call(
+                server=server,
+                tool=tool,
+                params=params,
+                success=success,
+                duration_ms=duration_ms,
+                result=result,
+                error=error,
+            )
 
     async def _async_call(
         self,
@@ -177,7 +376,10 @@ class MCPRuntime:
             raise
 
     def clear(self) -> None:
-        """Clear registered servers."""
+        """Clear registered servers and stop the loop thread."""
         self.servers.clear()
+        if self._loop_thread is not None:
+            self._loop_thread.stop()
+            self._loop_thread = None
         self._event_loop = None
         logger.info("Cleared MCP runtime")
@@ -4,19 +4,305 @@ Skill Manager - Persists and manages agent skills.
 Provides both filesystem (immediate) and database (async) persistence.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple, cast
 from pathlib import Path
+import ast
+import copy
 import json
 import logging
+import os
 import re
+import shutil
 import asyncio
+import functools
+import queue
 import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from .database import SkillsDatabase
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued skills persisted in one database transaction
+_PERSIST_BATCH_SIZE = 64
+
+# Queued skills beyond this make save_skill wait for the persist thread
+_PERSIST_QUEUE_SIZE = 1024
+
+# Sentinel that tells the persist thread to exit
+_STOP = object()
+
+# Worker threads for overlapping skill file reads
+_IO_WORKERS = 32
+
+# Below this many files, reading serially beats dispatching to the pool
+_PARALLEL_READ_MIN = 8
+
+# String literal prefixes (r"", b'', rb"", f"", ...) at the start of code
+_STRING_PREFIX_RE = re.compile(r'[rRbBuUfF]{1,2}["\']')
+
+# Matches mcp_call('server', 'tool', ...) or mcp_call("server", "tool", ...)
+_MCP_CALL_RE = re.compile(r'mcp_call\s*\(\s*["\']([^"\']+)["\']\s*,\s*["\']([^"\']+)["\']')
+
+
+def _dump_meta(metadata: Dict[str, Any]) -> bytes:
+    """
+    Encode skill metadata as compact JSON bytes.
+
+    .meta.json is machine-read; without indent the stdlib encoder stays on
+    its C fast path.
+    """
+    if orjson is not None:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+
+
+def _parse_meta(data: bytes) -> Dict[str, Any]:
+    """Decode skill metadata from JSON bytes."""
+    if orjson is not None:
+        return cast(Dict[str, Any], orjson.loads(data))
+    return cast(Dict[str, Any], json.loads(data))
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file with raw os calls, bypassing the text I/O layer.
+
+    Args:
+        path: File to create or truncate
+        data: Encoded file contents
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_source(code: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Parse code once for its docstring and mcp_call() dependencies.
+
+    Memoized on the code string; str caches its own hash, so lookups
+    don't rescan the code. Results are immutable so cached values can be
+    shared safely.
+
+    Args:
+        code: Python code
+
+    Returns:
+        Tuple of (docstring or empty string, unique (server, tool) pairs)
+    """
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError) as e:
+        logger.warning(f"Failed to extract docstring: {e}")
+        return "", tuple(dict.fromkeys(_MCP_CALL_RE.findall(code)))
+
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or len(node.args) < 2:
+            continue
+
+        func = node.func
+        func_name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if func_name != "mcp_call":
+            continue
+
+        server, tool = node.args[0], node.args[1]
+        if (
+            isinstance(server, ast.Constant) and isinstance(server.value, str)
+            and isinstance(tool, ast.Constant) and isinstance(tool.value, str)
+        ):
+            calls.append((node.lineno, node.col_offset, server.value, tool.value))
+
+    # ast.walk is breadth-first; report dependencies in source order
+    calls.sort()
+    pairs = tuple(dict.fromkeys((server, tool) for _, _, server, tool in calls))
+
+    return ast.get_docstring(tree) or "", pairs
+
+
+def _subdirs(path: Path) -> List[Path]:
+    """
+    List the subdirectories of a directory.
+
+    Uses os.scandir, whose entries usually answer is_dir() from the
+    directory listing itself instead of a stat() per entry.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        Paths of the subdirectories
+    """
+    with os.scandir(path) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir()]
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Get a file's (mtime_ns, size) for cache validation.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        (mtime_ns, size), or None if the file doesn't exist
+    """
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _read_optional(path: Path) -> Optional[bytes]:
+    """
+    Read a file's bytes, or None if it doesn't exist.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File contents or None
+    """
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _load_meta(meta_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read and decode a skill's .meta.json.
+
+    Args:
+        meta_path: Path to .meta.json
+
+    Returns:
+        Metadata dict, or None if the file is missing or unreadable
+    """
+    try:
+        return _parse_meta(meta_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load metadata for {meta_path.parent}: {e}")
+        return None
+
+
+async def _persist_skills(
+    db: SkillsDatabase,
+    agent_name: str,
+    telemetry: Any,
+    skills: List[Dict[str, Any]],
+) -> None:
+    """
+    Persist several skills to database in one transaction.
+
+    Args:
+        db: Skills database
+        agent_name: Agent the skills belong to
+        telemetry: TelemetryLogger for skill events, or None
+        skills: Skill dicts with name, category, code, dependencies, metadata
+    """
+    try:
+        # Ensure database is initialized
+        await db.initialize()
+
+        # Save to database
+        await db.save_skills(agent_name, skills)
+
+        for skill in skills:
+            logger.info(f"Skill persisted to database: {agent_name}/{skill['name']}")
+
+            # Log telemetry
+            if telemetry:
+                telemetry.log_event(
+                    level="INFO",
+                    event_type="skill_db_persist",
+                    data={
+                        "agent_name": agent_name,
+                        "skill_name": skill['name'],
+                        "category": skill['category']
+                    }
+                )
+
+    except Exception as e:
+        logger.error(f"Failed to persist skill to database: {e}")
+        # Don't raise - this is async background task
+
+
+def _persist_loop(
+    persist_queue: queue.Queue,
+    db: SkillsDatabase,
+    agent_name: str,
+    telemetry: Any,
+) -> None:
+    """
+    Persist thread loop: write queued skills in batches until stopped.
+
+    Takes the manager's parts rather than the manager, so the thread
+    doesn't keep an unclosed SkillManager alive.
+
+    Args:
+        persist_queue: Queue of skill dicts, ended by _STOP
+        db: Skills database
+        agent_name: Agent the skills belong to
+        telemetry: TelemetryLogger for skill events, or None
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            batch = [persist_queue.get()]
+            while len(batch) < _PERSIST_BATCH_SIZE:
+                try:
+                    batch.append(persist_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = _STOP in batch
+            skills = [item for item in batch if item is not _STOP]
+            try:
+                if skills:
+                    loop.run_until_complete(
+                        _persist_skills(db, agent_name, telemetry, skills)
+                    )
+            finally:
+                for _ in batch:
+                    persist_queue.task_done()
+
+            if stop:
+                return
+    finally:
+        loop.close()
+
+
+def _stop_persist_thread(persist_queue: queue.Queue, thread: threading.Thread) -> None:
+    """
+    Persist what's queued, then stop the persist thread.
+
+    Args:
+        persist_queue: Queue the thread reads from
+        thread: Persist thread
+    """
+    if thread.is_alive():
+        persist_queue.put(_STOP)
+        if thread is not threading.current_thread():
+            thread.join()
+
 
 class SkillManager:
     """
@@ -27,6 +313,9 @@ class SkillManager:
     2. Immediately writes new skills to filesystem (for agent to use)
     3. Asynchronously persists skills to database (for future hydration)
     4. Extracts and tracks MCP tool dependencies
+
+    Database persistence runs on a single background thread that drains a
+    queue of saved skills and writes them in batched transactions.
     """
 
     def __init__(
@@ -51,6 +340,32 @@ class SkillManager:
         self.telemetry = telemetry
         self._db_initialized = False
 
+        # Background database persistence (started on first use)
+        self._persist_queue: queue.Queue = queue.Queue(maxsize=_PERSIST_QUEUE_SIZE)
+        self._persist_thread: Optional[threading.Thread] = None
+        # Drains the persist thread on close(), garbage collection or
+        # interpreter exit, whichever comes first
+        self._persist_finalizer: Optional[weakref.finalize] = None
+        self._persist_lock = threading.Lock()
+
+        # Thread pool for filesystem reads (started on first use)
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+        # Read caches, validated by mtime and invalidated on writes:
+        # category -> (category dir mtime_ns, skill dirs)
+        self._list_cache: Dict[str, Tuple[int, List[Path]]] = {}
+        # (category, name) -> ((mtime_ns, size) of .meta.json, README.md and
+        # main.py, skill info)
+        self._info_cache: Dict[Tuple[str, str], Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+        # .meta.json path -> ((mtime_ns, size), parsed metadata), so rescanning a
+        # changed category only re-parses the skills that changed
+        self._meta_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # (skills dir mtime_ns, category dirs)
+        self._category_dirs_cache: Optional[Tuple[int, List[Path]]] = None
+
+        # Skill dirs already created, so rewrites skip mkdir
+        self._known_dirs: Set[Path] = set()
+
     async def initialize(self) -> None:
         """Initialize database (async operation)."""
         if not self._db_initialized:
@@ -72,26 +387,58 @@ class SkillManager:
         # Ensure database is initialized
         await self.initialize()
 
-        # Clear existing skills directory
+        # Move the existing skills directory aside (O(1)) and delete it in
+        # the background while skills are read and written
+        cleanup = None
         if self.skills_dir.exists():
-            import shutil
-            shutil.rmtree(self.skills_dir)
+            old_dir = self.skills_dir.with_name(
+                f"{self.skills_dir.name}.old.{os.getpid()}.{time.time_ns()}"
+            )
+            os.replace(self.skills_dir, old_dir)
+            cleanup = asyncio.create_task(asyncio.to_thread(shutil.rmtree, old_dir, True))
         self.skills_dir.mkdir(parents=True, exist_ok=True)
+        self._list_cache.clear()
+        self._info_cache.clear()
+        self._meta_cache.clear()
+        self._category_dirs_cache = None
+        self._known_dirs.clear()
+
+        # Stream skills from the database and hand each to the thread pool
+        # as it arrives, so database reads and file writes overlap
+        loop = asyncio.get_running_loop()
+        pool = self._get_io_pool()
+        now = datetime.now()
+        created = now.isoformat()
+        today = now.strftime('%Y-%m-%d')
+        writes = []
 
-        # Get all skills from database
-        skills = await self.db.get_all_skills(self.agent_name)
+        try:
+            async for skill in self.db.iter_all_skills(self.agent_name):
+                writes.append(loop.run_in_executor(
+                    pool,
+                    functools.partial(
+                        self._write_to_filesystem,
+                        name=skill['skill_name'],
+                        category=skill['category'],
+                        code=skill['code'],
+                        dependencies=skill.get('dependencies', []),
+                        metadata=skill.get('metadata', {}),
+                        created=created,
+                        today=today
+                    )
+                ))
+        finally:
+            # Wait for in-flight writes and cleanup even if streaming failed
+            await asyncio.gather(*writes, return_exceptions=True)
+            if cleanup is not None:
+                await cleanup
 
-        # Write each skill to filesystem
-        for skill in skills:
-            self._write_to_filesystem(
-                name=skill['skill_name'],
-                category=skill['category'],
-                code=skill['code'],
-                dependencies=skill.get('dependencies', []),
-                metadata=skill.get('metadata', {})
-            )
+        # Surface the first write error, as a serial loop would have
+        for write in writes:
+            write.result()
 
-        logger.info(f"Hydrated {len(skills)} skills from database")
+        skills_count = len(writes)
+        logger.info(f"Hydrated {skills_count} skills from database")
 
         # Log telemetry
         if self.telemetry:
@@ -100,11 +447,11 @@ class SkillManager:
                 event_type="skill_hydration",
                 data={
                     "agent_name": self.agent_name,
-                    "skills_count": len(skills)
+                    "skills_count": skills_count
                 }
             )
 
-        return len(skills)
+        return skills_count
 
     def save_skill(
         self,
@@ -132,47 +479,188 @@ class SkillManager:
             tags: Optional tags for discovery
             persist_to_db: Whether to async persist to database
         """
+        skill = self._save_to_filesystem(code, name, category, tags)
+
+        # Log telemetry
+        if self.telemetry:
+            code_lines = code.count('\n') + 1
+            self.telemetry.log_skill_save(
+                category=category,
+                name=name,
+                code_lines=code_lines,
+                dependencies=skill["dependencies"],
+            )
+
+        # Async persist to database (fire and forget)
+        if persist_to_db:
+            self._ensure_persist_thread()
+            self._persist_queue.put(skill)
+
+    def save_skills(
+        self,
+        skills: List[Dict[str, Any]],
+        persist_to_db: bool = True
+    ) -> None:
+        """
+        Save several skills at once.
+
+        Skills are analyzed and written to the filesystem in parallel with a
+        shared timestamp, and logged as a single telemetry event. If the
+        batch names the same skill more than once, the last entry wins.
+
+        Args:
+            skills: Dicts with 'code' and 'name' keys, plus optional
+                'category' (default "general") and 'tags'
+            persist_to_db: Whether to async persist to database
+        """
+        now = datetime.now()
+        created = now.isoformat()
+        today = now.strftime('%Y-%m-%d')
+
+        # Keep only the last entry per (category, name): parallel writers to
+        # the same skill dir would interleave their truncating writes
+        skills = list({
+            (item.get("category", "general"), item["name"]): item for item in skills
+        }.values())
+
+        saved = self._map_io(
+            lambda item: self._save_to_filesystem(
+                code=item["code"],
+                name=item["name"],
+                category=item.get("category", "general"),
+                tags=item.get("tags"),
+                created=created,
+                today=today,
+            ),
+            skills,
+        )
+
+        # Log telemetry
+        if self.telemetry:
+            self.telemetry.log_skill_save_batch([
+                {
+                    "category": skill["category"],
+                    "name": skill["name"],
+                    "code_lines": skill["code"].count('\n') + 1,
+                    "dependencies": skill["dependencies"],
+                }
+                for skill in saved
+            ])
+
+        # Async persist to database (fire and forget)
+        if persist_to_db:
+            self._ensure_persist_thread()
+            for skill in saved:
+                self._persist_queue.put(skill)
+
+    def _save_to_filesystem(
+        self,
+        code: str,
+        name: str,
+        category: str,
+        tags: Optional[List[str]] = None,
+        created: Optional[str] = None,
+        today: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze a skill's code and write it to the filesystem.
+
+        Args:
+            code: Python code to save
+            name: Skill name
+            category: Skill category
+            tags: Optional tags for discovery
+            created: ISO timestamp for .meta.json (defaults to now)
+            today: YYYY-MM-DD date for README (defaults to today)
+
+        Returns:
+            Skill dict with name, category, code, dependencies, metadata,
+            ready to queue for database persistence
+        """
         logger.info(f"Saving skill: {category}/{name}")
 
-        # Extract dependencies from code
-        dependencies = self._extract_dependencies(code)
+        # Extract docstring and dependencies in one parse
+        docstring, dependencies = self._analyze_code(code)
 
         # Build metadata
         metadata = {
             "tags": tags or [],
-            "description": self._extract_docstring(code)
+            "description": docstring
         }
 
         # Immediately write to filesystem
-        self._write_to_filesystem(name, category, code, dependencies, metadata)
+        self._write_to_filesystem(
+            name, category, code, dependencies, metadata,
+            docstring=docstring, created=created, today=today
+        )
 
         logger.info(f"Skill saved to filesystem: {category}/{name}")
 
-        # Log telemetry
-        if self.telemetry:
-            code_lines = len(code.split('\n'))
-            self.telemetry.log_skill_save(
-                category=category,
-                name=name,
-                code_lines=code_lines,
-                dependencies=dependencies,
-            )
+        return {
+            "name": name,
+            "category": category,
+            "code": code,
+            "dependencies": dependencies,
+            "metadata": metadata,
+        }
 
-        # Async persist to database (fire and forget)
-        if persist_to_db:
-            try:
-                # Try to create task in running event loop
-                asyncio.create_task(
-                    self._persist_to_database(name, category, code, dependencies, metadata)
+    def _ensure_persist_thread(self) -> None:
+        """Start the background persist thread if it isn't running."""
+        with self._persist_lock:
+            if self._persist_thread is None or not self._persist_thread.is_alive():
+                self._persist_thread = threading.Thread(
+                    target=_persist_loop,
+                    args=(self._persist_queue, self.db, self.agent_name, self.telemetry),
+                    name="skill-persist",
+                    daemon=True,
                 )
-            except RuntimeError:
-                # No event loop running - run in background thread
-                def run_async():
-                    asyncio.run(
-                        self._persist_to_database(name, category, code, dependencies, metadata)
-                    )
-                thread = threading.Thread(target=run_async, daemon=True)
-                thread.start()
+                self._persist_thread.start()
+                self._persist_finalizer = weakref.finalize(
+                    self, _stop_persist_thread, self._persist_queue, self._persist_thread
+                )
+
+    def flush(self) -> None:
+        """Block until all queued skills have been persisted to the database."""
+        if self._persist_thread is not None and self._persist_thread.is_alive():
+            self._persist_queue.join()
+
+    def close(self) -> None:
+        """Persist queued skills and stop the background threads."""
+        with self._persist_lock:
+            if self._persist_finalizer is not None:
+                self._persist_finalizer()
+                self._persist_finalizer = None
+            self._persist_thread = None
+
+            if self._io_pool is not None:
+                self._io_pool.shutdown()
+                self._io_pool = None
+
+    def _map_io(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        Apply an I/O-bound function to items, in parallel when worthwhile.
+
+        Args:
+            func: Function to apply
+            items: Items to apply it to
+
+        Returns:
+            Results in the same order as items
+        """
+        if len(items) < _PARALLEL_READ_MIN:
+            return [func(item) for item in items]
+
+        return list(self._get_io_pool().map(func, items))
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Get the shared filesystem thread pool, starting it if needed."""
+        with self._persist_lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(
+                    max_workers=_IO_WORKERS,
+                    thread_name_prefix="skill-io",
+                )
+            return self._io_pool
 
     async def _persist_to_database(
         self,
@@ -192,37 +680,22 @@ class SkillManager:
             dependencies: MCP tool dependencies
             metadata: Additional metadata
         """
-        try:
-            # Ensure database is initialized
-            await self.initialize()
-
-            # Save to database
-            await self.db.save_skill(
-                agent_name=self.agent_name,
-                skill_name=name,
-                category=category,
-                code=code,
-                dependencies=dependencies,
-                metadata=metadata
-            )
-
-            logger.info(f"Skill persisted to database: {self.agent_name}/{name}")
+        await self._persist_batch([{
+            "name": name,
+            "category": category,
+            "code": code,
+            "dependencies": dependencies,
+            "metadata": metadata,
+        }])
 
-            # Log telemetry
-            if self.telemetry:
-                self.telemetry.log_event(
-                    level="INFO",
-                    event_type="skill_db_persist",
-                    data={
-                        "agent_name": self.agent_name,
-                        "skill_name": name,
-                        "category": category
-                    }
-                )
+    async def _persist_batch(self, skills: List[Dict[str, Any]]) -> None:
+        """
+        Persist several skills to database in one transaction.
 
-        except Exception as e:
-            logger.error(f"Failed to persist skill to database: {e}")
-            # Don't raise - this is async background task
+        Args:
+            skills: Skill dicts with name, category, code, dependencies, metadata
+        """
+        await _persist_skills(self.db, self.agent_name, self.telemetry, skills)
 
     def _write_to_filesystem(
         self,
@@ -230,7 +703,10 @@ class SkillManager:
         category: str,
         code: str,
         dependencies: Optional[List[Dict[str, str]]] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        docstring: Optional[str] = None,
+        created: Optional[str] = None,
+        today: Optional[str] = None
     ) -> None:
         """
         Write skill to filesystem as importable package.
@@ -241,6 +717,9 @@ class SkillManager:
             code: Skill code
             dependencies: MCP tool dependencies
             metadata: Additional metadata
+            docstring: Module docstring, if already extracted
+            created: ISO timestamp for .meta.json (defaults to now)
+            today: YYYY-MM-DD date for README (defaults to today)
         """
         # Normalize None to empty dict/list
         dependencies = dependencies or []
@@ -248,69 +727,171 @@ class SkillManager:
 
         # Create skill directory
         skill_dir = self.skills_dir / category / name
-        skill_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save main.py
-        main_py_path = skill_dir / "main.py"
-        main_py_path.write_text(code)
+        self._list_cache.pop(category, None)
+        self._info_cache.pop((category, name), None)
+        self._meta_cache.pop(skill_dir / ".meta.json", None)
+        self._ensure_dir(skill_dir)
+
+        # One clock read for both the metadata timestamp and the README date
+        if created is None or today is None:
+            now = datetime.now()
+            created = created or now.isoformat()
+            today = today or now.strftime('%Y-%m-%d')
 
-        # Extract docstring and generate README
-        docstring = self._extract_docstring(code)
+        # Extract docstring (unless the caller already has it) and generate README
+        if docstring is None:
+            docstring = self._extract_docstring(code)
         readme_content = self._generate_readme(
-            name, category, docstring, metadata.get('tags', [])
+            name, category, docstring, metadata.get('tags', []), today=today
         )
-        readme_path = skill_dir / "README.md"
-        readme_path.write_text(readme_content)
 
-        # Generate and save metadata (with dependencies)
+        # Generate metadata (with dependencies)
         file_metadata = {
             "name": name,
             "category": category,
-            "created": datetime.now().isoformat(),
+            "created": created,
             "dependencies": dependencies,
             **metadata
         }
+
+        # Save main.py, README.md, .meta.json and __init__.py (for imports)
         meta_path = skill_dir / ".meta.json"
-        meta_path.write_text(json.dumps(file_metadata, indent=2))
+        meta_bytes = _dump_meta(file_metadata)
+        try:
+            _write_file(skill_dir / "main.py", code.encode("utf-8"))
+        except FileNotFoundError:
+            # Directory was removed behind our back; recreate it and retry once
+            self._known_dirs.discard(skill_dir)
+            self._category_dirs_cache = None
+            skill_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(skill_dir)
+            _write_file(skill_dir / "main.py", code.encode("utf-8"))
+        _write_file(skill_dir / "README.md", readme_content.encode("utf-8"))
+        _write_file(meta_path, meta_bytes)
+        _write_file(
+            skill_dir / "__init__.py",
+            f'"""{docstring or name}"""\n\nfrom .main import *\n'.encode("utf-8"),
+        )
+
+        # Seed the metadata cache so listing this skill later costs a stat()
+        # instead of reading .meta.json back
+        meta_stat = os.stat(meta_path)
+        self._meta_cache[meta_path] = (
+            (meta_stat.st_mtime_ns, meta_stat.st_size), _parse_meta(meta_bytes)
+        )
+
+    def _ensure_dir(self, path: Path) -> None:
+        """
+        Create a directory (and parents) unless this manager already did.
 
-        # Create __init__.py for imports
-        init_path = skill_dir / "__init__.py"
-        init_path.write_text(f'"""{docstring or name}"""\n\nfrom .main import *\n')
+        Args:
+            path: Directory to create
+        """
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+            # May have created a category; don't rely on mtime granularity
+            self._category_dirs_cache = None
 
-    def list_skills(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_skills(
+        self,
+        category: Optional[str] = None,
+        fields: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         List available skills from filesystem.
 
+        A category's skill dirs are rescanned only when its directory mtime
+        has changed since the last listing or a skill in it was written.
+        Each skill's .meta.json is stat'ed on every call and re-read only if
+        it changed, so rewrites by other processes are picked up.
+
         Args:
             category: Optional category filter
+            fields: Optional metadata keys to return (e.g. {"name", "path"});
+                other keys such as dependencies are not copied
 
         Returns:
             List of skill metadata dicts
         """
-        skills = []
-
         # Determine which categories to scan
         if category:
             category_dirs = [self.skills_dir / category] if (self.skills_dir / category).exists() else []
         else:
-            category_dirs = [d for d in self.skills_dir.iterdir() if d.is_dir()]
+            category_dirs = self._category_dirs()
 
-        # Scan each category
+        # Reuse cached skill dir listings for categories that haven't changed
+        skill_dirs: List[Path] = []
         for category_dir in category_dirs:
-            for skill_dir in category_dir.iterdir():
-                if not skill_dir.is_dir():
-                    continue
+            mtime_ns = os.stat(category_dir).st_mtime_ns
+            cached = self._list_cache.get(category_dir.name)
+            if cached is None or cached[0] != mtime_ns:
+                cached = (mtime_ns, _subdirs(category_dir))
+                self._list_cache[category_dir.name] = cached
+            skill_dirs.extend(cached[1])
+
+        # Metadata copies, validated against each file's stat
+        all_metadata = self._map_io(
+            self._load_meta_cached, [skill_dir / ".meta.json" for skill_dir in skill_dirs]
+        )
+
+        listings = []
+        for skill_dir, metadata in zip(skill_dirs, all_metadata):
+            if metadata is None:
+                continue
+            metadata['path'] = str(skill_dir.relative_to(self.skills_dir))
+            if fields is not None:
+                metadata = {key: metadata[key] for key in fields if key in metadata}
+            listings.append(metadata)
+
+        return listings
+
+    def _category_dirs(self) -> List[Path]:
+        """
+        List category directories, rescanning only when skills_dir changes.
+
+        Creating or removing a category updates the skills directory's
+        mtime, which invalidates the cached listing.
+
+        Returns:
+            Paths of the category directories
+        """
+        mtime_ns = os.stat(self.skills_dir).st_mtime_ns
+        cached = self._category_dirs_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        category_dirs = _subdirs(self.skills_dir)
+        self._category_dirs_cache = (mtime_ns, category_dirs)
+        return category_dirs
+
+    def _load_meta_cached(self, meta_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load a skill's metadata, reusing the parsed copy if the file is unchanged.
+
+        Args:
+            meta_path: Path to .meta.json
+
+        Returns:
+            Deep copy of the metadata dict, or None if missing or unreadable
+        """
+        try:
+            meta_stat = os.stat(meta_path)
+        except FileNotFoundError:
+            return None
+
+        stat_key = (meta_stat.st_mtime_ns, meta_stat.st_size)
+        cached = self._meta_cache.get(meta_path)
+        if cached is not None and cached[0] == stat_key:
+            return copy.deepcopy(cached[1])
 
-                meta_path = skill_dir / ".meta.json"
-                if meta_path.exists():
-                    try:
-                        metadata = json.loads(meta_path.read_text())
-                        metadata['path'] = str(skill_dir.relative_to(self.skills_dir))
-                        skills.append(metadata)
-                    except Exception as e:
-                        logger.warning(f"Failed to load metadata for {skill_dir}: {e}")
+        metadata = _load_meta(meta_path)
+        if metadata is None:
+            return None
 
-        return skills
+        self._meta_cache[meta_path] = (stat_key, metadata)
+        return copy.deepcopy(metadata)
 
     def get_skill_categories(self) -> List[Dict[str, Any]]:
         """
@@ -329,13 +910,10 @@ class SkillManager:
             return []
 
         categories = []
-        for category_dir in self.skills_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
-
+        for category_dir in self._category_dirs():
             # Count skills in this category
-            skill_count = sum(1 for d in category_dir.iterdir()
-                            if d.is_dir() and (d / ".meta.json").exists())
+            skill_count = sum(1 for d in _subdirs(category_dir)
+                            if os.path.exists(os.path.join(d, ".meta.json")))
 
             if skill_count > 0:
                 categories.append({
@@ -363,22 +941,37 @@ class SkillManager:
 
         # Load metadata
         meta_path = skill_dir / ".meta.json"
-        if not meta_path.exists():
+        try:
+            meta_stat = os.stat(meta_path)
+        except FileNotFoundError:
             raise ValueError(f"Skill metadata not found: {category}/{name}")
 
-        metadata = json.loads(meta_path.read_text())
-
-        # Load README
-        readme_path = skill_dir / "README.md"
-        if readme_path.exists():
-            metadata['readme'] = readme_path.read_text()
+        # Keyed on all three files, so edits to main.py or README.md made
+        # outside this manager are seen too
+        cache_key = (
+            (meta_stat.st_mtime_ns, meta_stat.st_size),
+            _stat_key(skill_dir / "README.md"),
+            _stat_key(skill_dir / "main.py"),
+        )
+        cached = self._info_cache.get((category, name))
+        if cached is not None and cached[0] == cache_key:
+            return copy.deepcopy(cached[1])
+
+        # Three small files; reading serially beats pool handoffs
+        meta_bytes = _read_optional(meta_path)
+        readme = _read_optional(skill_dir / "README.md")
+        code = _read_optional(skill_dir / "main.py")
+        if meta_bytes is None:
+            raise ValueError(f"Skill metadata not found: {category}/{name}")
 
-        # Load code
-        main_py_path = skill_dir / "main.py"
-        if main_py_path.exists():
-            metadata['code'] = main_py_path.read_text()
+        metadata = _parse_meta(meta_bytes)
+        if readme is not None:
+            metadata['readme'] = readme.decode("utf-8")
+        if code is not None:
+            metadata['code'] = code.decode("utf-8")
 
-        return metadata
+        self._info_cache[(category, name)] = (cache_key, metadata)
+        return copy.deepcopy(metadata)
 
     async def get_database_stats(self) -> Dict[str, Any]:
         """
@@ -390,32 +983,56 @@ class SkillManager:
         await self.initialize()
         return await self.db.get_agent_stats(self.agent_name)
 
+    def _analyze_code(self, code: str) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Extract docstring and MCP tool dependencies in a single AST pass.
+
+        Only real mcp_call() invocations with literal server/tool names
+        count as dependencies, so strings that merely mention mcp_call are
+        ignored. Falls back to the regex scan if the code does not parse.
+        Results are memoized, so re-saving identical code skips the parse.
+
+        Args:
+            code: Python code
+
+        Returns:
+            Tuple of (docstring or empty string, dependency dicts)
+        """
+        docstring, pairs = _analyze_source(code)
+        return docstring, [{"server": server, "tool": tool} for server, tool in pairs]
+
     def _extract_docstring(self, code: str) -> str:
         """
         Extract docstring from Python code.
 
+        Shares _analyze_code's memoized parse, so a skill gets the same
+        docstring whether it was saved or hydrated, including code that
+        does not parse.
+
         Args:
             code: Python code
 
         Returns:
             Extracted docstring or empty string
         """
-        import ast
-
-        try:
-            tree = ast.parse(code)
-            docstring = ast.get_docstring(tree)
-            return docstring or ""
-        except Exception as e:
-            logger.warning(f"Failed to extract docstring: {e}")
+        # Code that opens with a name (def, import, ...) has no docstring
+        # whether or not it parses, so this agrees with _analyze_source;
+        # comments and brackets may still precede one, so those are parsed
+        stripped = code.lstrip()
+        if not stripped or (
+            stripped[0].isidentifier() and not _STRING_PREFIX_RE.match(stripped)
+        ):
             return ""
 
+        return _analyze_source(code)[0]
+
     def _generate_readme(
         self,
         name: str,
         category: str,
         docstring: str,
         tags: Optional[List[str]] = None,
+        today: Optional[str] = None,
     ) -> str:
         """
         Generate README content for a skill.
@@ -425,64 +1042,22 @@ class SkillManager:
             category: Skill category
             docstring: Extracted docstring
             tags: Optional tags
+            today: Creation date as YYYY-MM-DD (defaults to today)
 
         Returns:
             README markdown content
         """
-        readme = f"""# {name}
-
-**Category:** {category}
-**Created:** {datetime.now().strftime('%Y-%m-%d')}
-
-## Description
-
-{docstring or 'No description available.'}
-
-## Usage
-
-```python
-from skills.{category}.{name} import *
-
-# Use the skill here
-```
-"""
-
+        # Joining literal pieces is several times faster than str.format on
+        # a template, which re-parses the format string on every call
+        parts = [
+            "# ", name,
+            "\n\n**Category:** ", category,
+            "\n**Created:** ", today or datetime.now().strftime('%Y-%m-%d'),
+            "\n\n## Description\n\n", docstring or 'No description available.',
+            "\n\n## Usage\n\n```python\nfrom skills.", category, ".", name,
+            " import *\n\n# Use the skill here\n```\n",
+        ]
         if tags:
-            readme += f"\n## Tags\n\n{', '.join(tags)}\n"
-
-        return readme
-
-    def _extract_dependencies(self, code: str) -> List[Dict[str, str]]:
-        """
-        Extract MCP tool dependencies from code.
-
-        Scans for mcp_call() invocations and extracts server/tool names.
-
-        Args:
-            code: Python code
-
-        Returns:
-            List of dependency dicts with 'server' and 'tool' keys
-        """
-        dependencies = []
-
-        # Pattern to match: mcp_call('server', 'tool', ...)
-        # or mcp_call("server", "tool", ...)
-        pattern = r'mcp_call\s*\(\s*["\']([^"\']+)["\']\s*,\s*["\']([^"\']+)["\']'
-
-        matches = re.finditer(pattern, code)
-        seen = set()
-
-        for match in matches:
-            server = match.group(1)
-            tool = match.group(2)
-            key = (server, tool)
-
-            if key not in seen:
-                dependencies.append({
-                    "server": server,
-                    "tool": tool,
-                })
-                seen.add(key)
+            parts.extend(("\n## Tags\n\n", ", ".join(tags), "\n"))
 
-        return dependencies
+        return "".join(parts)
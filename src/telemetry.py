@@ -11,13 +11,262 @@ Provides observability into:
 import sqlite3
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import math
+import re
+import threading
+import time
+import weakref
+from typing import Deque, Dict, Any, Iterator, Optional, List, cast
 from pathlib import Path
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Allowed shapes for caller-supplied pragmas (see TelemetryLogger._set_pragma)
+_PRAGMA_NAME_RE = re.compile(r"[A-Za-z_]+")
+_PRAGMA_VALUE_RE = re.compile(r"-?\w+")
+
+# Events buffered for the writer at most; when it falls behind, the oldest
+# are dropped (and counted) so memory stays bounded
+_MAX_PENDING_EVENTS = 10000
+
+# Logged MCP params: strings longer than this many characters, and
+# containers with more items than _MAX_PARAM_ITEMS, are replaced by a summary
+_MAX_PARAM_CHARS = 4096
+_MAX_PARAM_ITEMS = 100
+
+# Event level names -> logging levels for the console echo
+_LOG_LEVELS = {
+    "ERROR": logging.ERROR,
+    "WARN": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
+
+# Maximum number of queued events inserted in one transaction
+_WRITE_BATCH_SIZE = 500
+
+# Bumped whenever the events table changes; stored in PRAGMA user_version
+# so existing databases are migrated once by _migrate_schema
+_SCHEMA_VERSION = 2
+
+# Timestamps are integer nanoseconds since the epoch (UTC). id is a plain
+# rowid alias: AUTOINCREMENT would cost a sqlite_sequence update per insert
+# just to never reuse ids of deleted events, which telemetry doesn't need.
+_CREATE_EVENTS_SQL = """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        timestamp INTEGER NOT NULL,
+        level TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        data TEXT NOT NULL,
+
+        -- Indexed fields for fast queries
+        server TEXT,
+        tool TEXT,
+        skill_category TEXT,
+        skill_name TEXT,
+        success INTEGER,
+        duration_ms INTEGER,
+        error_type TEXT
+    )
+"""
+
+# One SQL string for every insert, so sqlite3 reuses its prepared statement
+_INSERT_EVENT_SQL = (
+    "INSERT INTO events ("
+    "timestamp, level, event_type, data, server, tool, skill_category, "
+    "skill_name, success, duration_ms, error_type"
+    ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Connection tuning: WAL lets metric queries read while events are written,
+# and synchronous=NORMAL skips the fsync per commit (safe under WAL)
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+"""
+
+
+def _summarize(value: Any) -> Any:
+    """
+    Shrink a logged parameter value to what telemetry needs.
+
+    Long strings and large lists/dicts become short placeholders, and bytes
+    (which JSON can't hold) are reduced to their length, so big payloads
+    don't dominate encoding time and database size.
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        The value itself if small, otherwise a summary
+    """
+    if isinstance(value, str):
+        if len(value) > _MAX_PARAM_CHARS:
+            return f"<truncated {len(value)} chars>"
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return f"<{len(value)} bytes>"
+    if isinstance(value, dict):
+        if len(value) > _MAX_PARAM_ITEMS:
+            return f"<truncated dict of {len(value)} items>"
+        return {key: _summarize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if len(value) > _MAX_PARAM_ITEMS:
+            return f"<truncated list of {len(value)} items>"
+        return [_summarize(item) for item in value]
+    return value
+
+
+def _load_data(data: str) -> Dict[str, Any]:
+    """Decode an event payload read from the data column."""
+    if orjson is not None:
+        try:
+            return cast(Dict[str, Any], orjson.loads(data))
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity written by json.dumps
+    return cast(Dict[str, Any], json.loads(data))
+
+
+def _format_timestamp(timestamp_ns: Optional[int]) -> Optional[str]:
+    """Format a stored ns-since-epoch timestamp as ISO-8601 UTC."""
+    if timestamp_ns is None:
+        return None
+    moment = datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _dump_data(data: Dict[str, Any]) -> str:
+    """
+    Encode an event payload as JSON text for the data column.
+
+    Uses orjson where it encodes exactly what json.dumps would, and falls
+    back to json.dumps for what it can't: integers beyond 64 bits (which
+    orjson rejects) and NaN/Infinity (which orjson writes as null).
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            # OPT_NON_STR_KEYS matches json.dumps, which stringifies int keys
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(data)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check a payload for NaN/Infinity floats, which orjson can't represent."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+
+class _WriterState:
+    """Rows waiting for the writer thread, and its progress."""
+
+    def __init__(self) -> None:
+        # Ring buffer of pending rows, guarded by cond
+        self.pending: Deque[tuple] = deque(maxlen=_MAX_PENDING_EVENTS)
+        self.cond = threading.Condition()
+        self.in_flight = 0
+        self.stopping = False
+
+
+def _write_events(
+    state: _WriterState,
+    connection: sqlite3.Connection,
+    lock: threading.Lock,
+    cursor: sqlite3.Cursor,
+) -> None:
+    """
+    Writer thread loop: insert buffered events until stopped.
+
+    Waits for events, then takes up to _WRITE_BATCH_SIZE of them and
+    inserts the lot in a single transaction, so a burst of events costs
+    one commit instead of one each. Drains the buffer before exiting.
+
+    Args:
+        state: Buffer shared with the logger
+        connection: Telemetry database connection
+        lock: Serializes connection use with the logger's queries
+        cursor: Cursor reserved for inserts
+    """
+    while True:
+        with state.cond:
+            state.cond.wait_for(lambda: state.pending or state.stopping)
+            if not state.pending:
+                return  # Stopping and fully drained
+
+            take = min(len(state.pending), _WRITE_BATCH_SIZE)
+            rows = [state.pending.popleft() for _ in range(take)]
+            state.in_flight = take
+
+        try:
+            with lock:
+                # Take the write lock up front rather than on the first
+                # insert, so a batch never fails half-way on a lock upgrade
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor.executemany(_INSERT_EVENT_SQL, rows)
+                    cursor.execute("COMMIT")
+                except Exception:
+                    connection.rollback()
+                    raise
+
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} telemetry events: {e}")
+
+        finally:
+            with state.cond:
+                state.in_flight = 0
+                state.cond.notify_all()
+
+
+def _shut_down(
+    state: _WriterState,
+    writer: threading.Thread,
+    connection: sqlite3.Connection,
+) -> None:
+    """
+    Drain and stop the writer thread, then close the connection.
+
+    Args:
+        state: Buffer shared with the writer
+        writer: Writer thread
+        connection: Telemetry database connection
+    """
+    if writer.is_alive():
+        with state.cond:
+            state.stopping = True
+            state.cond.notify_all()
+        if writer is threading.current_thread():
+            return  # Collected on the writer itself; it exits once drained
+        writer.join()
+
+    try:
+        # Refresh query planner statistics for the next session
+        connection.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass  # Already closed
+    connection.close()
+    logger.info("Telemetry logger closed")
+
 
 class TelemetryLogger:
     """
@@ -25,14 +274,20 @@ class TelemetryLogger:
 
     Stores all events in a single table with JSON payload,
     enabling rich queries while maintaining flexibility.
+
+    Events are written by a background thread so that logging never
+    blocks the caller on SQLite I/O. Query methods flush pending events
+    before reading.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pragmas: Optional[Dict[str, Any]] = None):
         """
         Initialize telemetry logger.
 
         Args:
             db_path: Path to SQLite database file
+            pragmas: Extra SQLite PRAGMA settings applied after the defaults,
+                e.g. {"synchronous": "OFF"} for a throwaway test database
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -40,36 +295,84 @@ class TelemetryLogger:
         # Create connection
         self.connection = sqlite3.connect(
             str(db_path),
-            check_same_thread=False  # Allow multi-threaded access
+            check_same_thread=False,  # Allow multi-threaded access
+            isolation_level=None,  # Autocommit; the writer opens its own transactions
         )
         self.connection.row_factory = sqlite3.Row  # Enable column access by name
+        self.connection.executescript(_CONNECTION_PRAGMAS)
+        try:
+            for name, value in (pragmas or {}).items():
+                self._set_pragma(name, value)
+        except ValueError:
+            self.connection.close()
+            raise
 
         self._init_schema()
+
+        # Serializes connection use between the writer thread and queries
+        self._lock = threading.Lock()
+
+        # Long-lived cursors, used only while holding _lock: one for the
+        # writer thread's inserts, one for the query methods
+        self._write_cursor = self.connection.cursor()
+        self._read_cursor = self.connection.cursor()
+
+        # Background writer keeps SQLite I/O off the caller's critical path.
+        # Its state lives outside the logger so the thread doesn't keep the
+        # logger alive.
+        self._writer_state = _WriterState()
+        self._dropped_count = 0
+        # Per-thread row buffer while inside batch()
+        self._batch_local = threading.local()
+        self._writer = threading.Thread(
+            target=_write_events,
+            args=(self._writer_state, self.connection, self._lock, self._write_cursor),
+            name="telemetry-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+        # Drains the writer and closes the connection on close(), when the
+        # logger is garbage collected, or at interpreter exit, whichever
+        # comes first
+        self._finalizer = weakref.finalize(
+            self, _shut_down, self._writer_state, self._writer, self.connection
+        )
+
         logger.info(f"Telemetry logger initialized: {db_path}")
 
+    def _set_pragma(self, name: str, value: Any) -> None:
+        """
+        Apply one PRAGMA setting to the connection.
+
+        PRAGMA arguments can't be bound as parameters, so names and values
+        are restricted to plain words and integers.
+
+        Args:
+            name: Pragma name (e.g. 'cache_size')
+            value: Keyword or integer value (e.g. 'WAL', -8000)
+
+        Raises:
+            ValueError: If the name or value is not a plain word or integer
+        """
+        if not _PRAGMA_NAME_RE.fullmatch(name) or not _PRAGMA_VALUE_RE.fullmatch(str(value)):
+            raise ValueError(f"Invalid telemetry pragma: {name}={value!r}")
+
+        self.connection.execute(f"PRAGMA {name}={value}")
+
     def _init_schema(self) -> None:
         """Initialize database schema."""
         cursor = self.connection.cursor()
 
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        has_events = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+        ).fetchone() is not None
+        if has_events and version < _SCHEMA_VERSION:
+            self._migrate_schema(version)
+
         # Create events table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                level TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                data TEXT NOT NULL,
-
-                -- Indexed fields for fast queries
-                server TEXT,
-                tool TEXT,
-                skill_category TEXT,
-                skill_name TEXT,
-                success INTEGER,
-                duration_ms INTEGER,
-                error_type TEXT
-            )
-        """)
+        cursor.execute(_CREATE_EVENTS_SQL)
 
         # Create indexes
         cursor.execute("""
@@ -77,11 +380,17 @@ class TelemetryLogger:
             ON events(timestamp)
         """)
 
+        # Covers get_health_snapshot: event_type IN (...) then a timestamp
+        # range, with success/duration_ms read from the index itself. Its
+        # event_type prefix also serves the per-type metric queries.
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_event_type
-            ON events(event_type)
+            CREATE INDEX IF NOT EXISTS idx_health_cover
+            ON events(event_type, timestamp, success, duration_ms)
         """)
 
+        # Superseded by idx_health_cover
+        cursor.execute("DROP INDEX IF EXISTS idx_event_type")
+
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_server_tool
             ON events(server, tool)
@@ -92,17 +401,137 @@ class TelemetryLogger:
             ON events(skill_category, skill_name)
         """)
 
+        # Partial index over failures only: it stays small on a healthy
+        # system and covers get_error_patterns (the planner still wants the
+        # success column present to treat it as covering)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_success
-            ON events(success)
+            CREATE INDEX IF NOT EXISTS idx_failures
+            ON events(error_type, event_type, timestamp, success)
+            WHERE success = 0
         """)
 
+        # Superseded by idx_failures; indexing every success value mostly
+        # indexed 1s
+        cursor.execute("DROP INDEX IF EXISTS idx_success")
+
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_error_type
             ON events(error_type)
         """)
 
-        self.connection.commit()
+        cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+        # Give the planner index statistics once; PRAGMA optimize on close
+        # keeps them current afterwards
+        has_stats = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone() is not None
+        if not has_stats:
+            cursor.execute("ANALYZE")
+
+    def _migrate_schema(self, version: int) -> None:
+        """
+        Rebuild an events table created by an older version of this module.
+
+        Runs in one transaction, so an interrupted migration leaves the old
+        table intact.
+
+        Args:
+            version: user_version the database was created with
+        """
+        logger.info(f"Migrating telemetry schema from version {version} to {_SCHEMA_VERSION}")
+
+        # Version 0 stored ISO-8601 text timestamps; convert to ns since epoch.
+        # Version 1 only differs by AUTOINCREMENT, so rows copy unchanged.
+        if version < 1:
+            timestamp_expr = (
+                "COALESCE(CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000) AS INTEGER), 0)"
+                " * 1000000"
+            )
+        else:
+            timestamp_expr = "timestamp"
+        columns = (
+            "level, event_type, data, server, tool, skill_category, "
+            "skill_name, success, duration_ms, error_type"
+        )
+
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute("ALTER TABLE events RENAME TO events_old")
+            cursor.execute(_CREATE_EVENTS_SQL)
+            cursor.execute(f"""
+                INSERT INTO events (id, timestamp, {columns})
+                SELECT id, {timestamp_expr}, {columns} FROM events_old
+            """)
+            # Dropping the old table also drops its indexes, which are
+            # recreated on the new table by _init_schema
+            cursor.execute("DROP TABLE events_old")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
+    def _enqueue(self, rows: List[tuple]) -> None:
+        """
+        Buffer rows for the writer thread.
+
+        Inside batch(), rows are held back until the block exits. If the
+        buffer is full, the oldest rows are evicted to make room and
+        counted in _dropped_count.
+
+        Args:
+            rows: Rows in _INSERT_EVENT_SQL column order
+        """
+        batch_rows = getattr(self._batch_local, "rows", None)
+        if batch_rows is not None:
+            batch_rows.extend(rows)
+            return
+
+        state = self._writer_state
+        with state.cond:
+            overflow = len(state.pending) + len(rows) - _MAX_PENDING_EVENTS
+            if overflow > 0:
+                self._dropped_count += overflow
+            state.pending.extend(rows)
+            state.cond.notify_all()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Hold back events logged by this thread and hand them over together.
+
+        Events logged inside the block reach the writer in one go when it
+        exits, so they are written in as few transactions as possible
+        (one, unless the block logs more than _WRITE_BATCH_SIZE events).
+        Nested blocks join the outermost one.
+
+        Example:
+            with telemetry.batch():
+                for attempt in range(3):
+                    telemetry.log_event(level="INFO", event_type="retry", data={"attempt": attempt})
+        """
+        if getattr(self._batch_local, "rows", None) is not None:
+            yield
+            return
+
+        self._batch_local.rows = []
+        try:
+            yield
+        finally:
+            rows = self._batch_local.rows
+            self._batch_local.rows = None
+            if rows:
+                self._enqueue(rows)
+
+    def flush(self) -> None:
+        """Block until all buffered events have been written."""
+        state = self._writer_state
+        if self._writer.is_alive():
+            with state.cond:
+                state.cond.wait_for(
+                    lambda: not (state.pending or state.in_flight) or not self._writer.is_alive()
+                )
 
     def _log_event(
         self,
@@ -118,7 +547,7 @@ class TelemetryLogger:
         error_type: Optional[str] = None,
     ) -> None:
         """
-        Log an event to the database.
+        Queue an event for the writer thread.
 
         Args:
             level: Log level (INFO, WARN, ERROR, DEBUG)
@@ -132,20 +561,37 @@ class TelemetryLogger:
             duration_ms: Operation duration in milliseconds
             error_type: Error type if failed
         """
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        self._enqueue([self._prepare_event(
+            level, event_type, data, server, tool, skill_category,
+            skill_name, success, duration_ms, error_type,
+        )])
 
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT INTO events (
-                timestamp, level, event_type, data,
-                server, tool, skill_category, skill_name,
-                success, duration_ms, error_type
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            timestamp,
+    def _prepare_event(
+        self,
+        level: str,
+        event_type: str,
+        data: Dict[str, Any],
+        server: Optional[str] = None,
+        tool: Optional[str] = None,
+        skill_category: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        success: Optional[bool] = None,
+        duration_ms: Optional[float] = None,
+        error_type: Optional[str] = None,
+    ) -> tuple:
+        """
+        Build an event's database row and echo the event to the console.
+
+        Takes the same arguments as _log_event().
+
+        Returns:
+            Row values in _INSERT_EVENT_SQL column order
+        """
+        row = (
+            time.time_ns(),
             level,
             event_type,
-            json.dumps(data),
+            _dump_data(data),
             server,
             tool,
             skill_category,
@@ -153,32 +599,27 @@ class TelemetryLogger:
             1 if success is True else (0 if success is False else None),
             duration_ms,
             error_type,
-        ))
-
-        self.connection.commit()
-
-        # Also log to console
-        log_msg = f"[{event_type}] "
-        if server and tool:
-            log_msg += f"{server}.{tool} "
-        elif skill_category and skill_name:
-            log_msg += f"{skill_category}/{skill_name} "
-
-        if success is not None:
-            log_msg += "✓" if success else "✗"
-        if duration_ms is not None:
-            log_msg += f" ({duration_ms:.0f}ms)"
-        if error_type:
-            log_msg += f" - {error_type}"
-
-        if level == "ERROR":
-            logger.error(log_msg)
-        elif level == "WARN":
-            logger.warning(log_msg)
-        elif level == "DEBUG":
-            logger.debug(log_msg)
-        else:
-            logger.info(log_msg)
+        )
+
+        # Also log to console, building the message only if it will be shown
+        log_level = _LOG_LEVELS.get(level, logging.INFO)
+        if logger.isEnabledFor(log_level):
+            log_msg = f"[{event_type}] "
+            if server and tool:
+                log_msg += f"{server}.{tool} "
+            elif skill_category and skill_name:
+                log_msg += f"{skill_category}/{skill_name} "
+
+            if success is not None:
+                log_msg += "✓" if success else "✗"
+            if duration_ms is not None:
+                log_msg += f" ({duration_ms:.0f}ms)"
+            if error_type:
+                log_msg += f" - {error_type}"
+
+            logger.log(log_level, log_msg)
+
+        return row
 
     def log_mcp_call(
         self,
@@ -203,7 +644,7 @@ class TelemetryLogger:
             error: Exception if failed
         """
         data = {
-            "params": params,
+            "params": _summarize(params),
         }
 
         if success and result is not None:
@@ -340,6 +781,26 @@ class TelemetryLogger:
             success=True,
         )
 
+    def log_skill_save_batch(self, skills: List[Dict[str, Any]]) -> None:
+        """
+        Log a batch of skill saves as one event.
+
+        Args:
+            skills: Dicts with category, name, code_lines and dependencies
+                for each saved skill
+        """
+        data = {
+            "count": len(skills),
+            "skills": skills,
+        }
+
+        self._log_event(
+            level="INFO",
+            event_type="skill_save_batch",
+            data=data,
+            success=True,
+        )
+
     def log_api_generation(
         self,
         server: str,
@@ -422,23 +883,26 @@ class TelemetryLogger:
         Returns:
             List of tool metrics with success/failure counts
         """
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT
-                server,
-                tool,
-                COUNT(*) as total_calls,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_calls,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_calls,
-                ROUND(AVG(duration_ms), 2) as avg_duration_ms,
-                ROUND(100.0 * SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as success_rate_pct
-            FROM events
-            WHERE event_type = 'mcp_call'
-            GROUP BY server, tool
-            ORDER BY total_calls DESC
-        """)
-
-        return [dict(row) for row in cursor.fetchall()]
+        self.flush()
+
+        with self._lock:
+            cursor = self._read_cursor
+            cursor.execute("""
+                SELECT
+                    server,
+                    tool,
+                    COUNT(*) as total_calls,
+                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_calls,
+                    SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_calls,
+                    ROUND(AVG(duration_ms), 2) as avg_duration_ms,
+                    ROUND(100.0 * SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as success_rate_pct
+                FROM events
+                WHERE event_type = 'mcp_call'
+                GROUP BY server, tool
+                ORDER BY total_calls DESC
+            """)
+
+            return [dict(row) for row in cursor]
 
     def get_skill_metrics(self) -> List[Dict[str, Any]]:
         """
@@ -447,23 +911,26 @@ class TelemetryLogger:
         Returns:
             List of skill metrics with success/failure counts
         """
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT
-                skill_category,
-                skill_name,
-                COUNT(*) as total_executions,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_executions,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_executions,
-                ROUND(AVG(duration_ms), 2) as avg_duration_ms,
-                ROUND(100.0 * SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as success_rate_pct
-            FROM events
-            WHERE event_type = 'skill_execution'
-            GROUP BY skill_category, skill_name
-            ORDER BY total_executions DESC
-        """)
-
-        return [dict(row) for row in cursor.fetchall()]
+        self.flush()
+
+        with self._lock:
+            cursor = self._read_cursor
+            cursor.execute("""
+                SELECT
+                    skill_category,
+                    skill_name,
+                    COUNT(*) as total_executions,
+                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_executions,
+                    SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed_executions,
+                    ROUND(AVG(duration_ms), 2) as avg_duration_ms,
+                    ROUND(100.0 * SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as success_rate_pct
+                FROM events
+                WHERE event_type = 'skill_execution'
+                GROUP BY skill_category, skill_name
+                ORDER BY total_executions DESC
+            """)
+
+            return [dict(row) for row in cursor]
 
     def get_error_patterns(self) -> List[Dict[str, Any]]:
         """
@@ -472,21 +939,30 @@ class TelemetryLogger:
         Returns:
             List of error types with occurrence counts
         """
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT
-                error_type,
-                event_type,
-                COUNT(*) as occurrences,
-                MAX(timestamp) as last_seen
-            FROM events
-            WHERE success = 0 AND error_type IS NOT NULL
-            GROUP BY error_type, event_type
-            ORDER BY occurrences DESC
-            LIMIT 20
-        """)
-
-        return [dict(row) for row in cursor.fetchall()]
+        self.flush()
+
+        with self._lock:
+            cursor = self._read_cursor
+            cursor.execute("""
+                SELECT
+                    error_type,
+                    event_type,
+                    COUNT(*) as occurrences,
+                    MAX(timestamp) as last_seen
+                FROM events
+                WHERE success = 0 AND error_type IS NOT NULL
+                GROUP BY error_type, event_type
+                ORDER BY occurrences DESC
+                LIMIT 20
+            """)
+
+            rows = [dict(row) for row in cursor]
+
+        # Convert only the returned rows' timestamps to ISO strings
+        for row in rows:
+            row["last_seen"] = _format_timestamp(row["last_seen"])
+
+        return rows
 
     def get_health_snapshot(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -498,28 +974,109 @@ class TelemetryLogger:
         Returns:
             Health metrics by event type
         """
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT
-                event_type,
-                COUNT(*) as total,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed,
-                ROUND(100.0 * SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as success_rate_pct,
-                ROUND(AVG(duration_ms), 2) as avg_duration_ms
-            FROM events
-            WHERE timestamp >= datetime('now', '-' || ? || ' hours')
-                AND event_type IN ('mcp_call', 'code_execution', 'skill_execution')
-            GROUP BY event_type
-        """, (hours,))
-
-        results = [dict(row) for row in cursor.fetchall()]
+        self.flush()
+
+        with self._lock:
+            cursor = self._read_cursor
+            cursor.execute("""
+                SELECT
+                    event_type,
+                    COUNT(*) as total,
+                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
+                    SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed,
+                    ROUND(100.0 * SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as success_rate_pct,
+                    ROUND(AVG(duration_ms), 2) as avg_duration_ms
+                FROM events
+                WHERE timestamp >= ?
+                    AND event_type IN ('mcp_call', 'code_execution', 'skill_execution')
+                GROUP BY event_type
+            """, (time.time_ns() - hours * 3600 * 1_000_000_000,))
+
+            results = [dict(row) for row in cursor]
 
         return {
             "hours": hours,
-            "metrics": results
+            "metrics": results,
+            # Events evicted from a full write buffer since startup
+            "dropped_events": self._dropped_count,
         }
 
+    def get_events(
+        self,
+        event_type: Optional[str] = None,
+        hours: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recent raw events, newest first, with payloads decoded.
+
+        Args:
+            event_type: Only return events of this type
+            hours: Only return events from the last N hours
+            limit: Maximum number of events to return
+
+        Returns:
+            Event dicts with all columns; data is decoded to a dict and
+            timestamp formatted as ISO-8601 UTC
+
+        Example:
+            failures = [
+                event for event in telemetry.get_events(event_type="mcp_call")
+                if event["success"] == 0
+            ]
+        """
+        self.flush()
+
+        conditions = []
+        params: List[Any] = []
+        if event_type is not None:
+            conditions.append("event_type = ?")
+            params.append(event_type)
+        if hours is not None:
+            conditions.append("timestamp >= ?")
+            params.append(time.time_ns() - hours * 3600 * 1_000_000_000)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            cursor = self._read_cursor
+            cursor.execute(f"""
+                SELECT * FROM events
+                {where}
+                ORDER BY id DESC
+                LIMIT ?
+            """, (*params, limit))
+
+            rows = [dict(row) for row in cursor]
+
+        for row in rows:
+            row["timestamp"] = _format_timestamp(row["timestamp"])
+            row["data"] = _load_data(row["data"])
+
+        return rows
+
+    def log_many(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Log several events at once.
+
+        The events are buffered together, so the writer inserts them in the
+        same transaction. Useful for callers that collect
+        events locally (e.g. per retry attempt) and flush them together.
+
+        Args:
+            events: Dicts with the log_event() arguments: level, event_type,
+                data and any indexed fields (server, tool, success, ...)
+
+        Example:
+            telemetry.log_many([
+                {"level": "INFO", "event_type": "retry", "data": {"attempt": 1}},
+                {"level": "ERROR", "event_type": "retry", "data": {"attempt": 2},
+                 "success": False, "error_type": "TimeoutError"},
+            ])
+        """
+        rows = [self._prepare_event(**event) for event in events]
+        if rows:
+            self._enqueue(rows)
+
     def log_event(
         self,
         level: str,
@@ -541,10 +1098,8 @@ class TelemetryLogger:
         self._log_event(level, event_type, data, **kwargs)
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.connection:
-            self.connection.close()
-            logger.info("Telemetry logger closed")
+        """Write pending events, stop the writer thread and close the connection."""
+        self._finalizer()
 
     def __enter__(self):
         """Context manager entry."""
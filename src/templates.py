@@ -2,10 +2,33 @@
 Templates for generating API files.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TextIO
+
 from jinja2 import Template
 
 
+# JSON schema type -> Python type hint
+_PY_TYPE_MAP = {
+    'string': 'str',
+    'number': 'float',
+    'integer': 'int',
+    'boolean': 'bool',
+    'array': 'list',
+    'object': 'dict',
+    'null': 'None',
+}
+
+# JSON schema type -> example literal for README usage snippets
+_EXAMPLE_MAP = {
+    'string': '"example"',
+    'number': '0.0',
+    'integer': '0',
+    'boolean': 'True',
+    'array': '[]',
+    'object': '{}',
+}
+
+
 MAIN_PY_TEMPLATE = Template("""\"\"\"{{ description }}\"\"\"
 
 from typing import Any
@@ -102,6 +125,26 @@ def generate_main_py(tool_schema: Any) -> str:
     Returns:
         Generated Python code
     """
+    return MAIN_PY_TEMPLATE.render(**_main_py_context(tool_schema))
+
+
+def generate_main_py_to(tool_schema: Any, fp: TextIO) -> None:
+    """
+    Stream main.py content from tool schema into an open file.
+
+    Writes template chunks as they are produced instead of building the
+    whole file as one string first.
+
+    Args:
+        tool_schema: ToolSchema object
+        fp: Text file (or buffer) to write to
+    """
+    for chunk in MAIN_PY_TEMPLATE.generate(**_main_py_context(tool_schema)):
+        fp.write(chunk)
+
+
+def _main_py_context(tool_schema: Any) -> Dict[str, Any]:
+    """Build the MAIN_PY_TEMPLATE variables for a tool schema."""
     # Build parameter signature
     param_parts = []
     for param in tool_schema.parameters:
@@ -115,12 +158,12 @@ def generate_main_py(tool_schema: Any) -> str:
             else:
                 param_parts.append(f"{param['name']}: {param_type} = {repr(default)}")
 
-    parameters = ", ".join(param_parts) if param_parts else ""
+    parameters = ", ".join(param_parts)
 
     # Return type (MCP doesn't provide this, so we default to Any)
     return_type = "Any"
 
-    return MAIN_PY_TEMPLATE.render(
+    return dict(
         server=tool_schema.server,
         tool=tool_schema.name,
         tool_name=tool_schema.name,
@@ -142,19 +185,34 @@ def generate_readme_md(tool_schema: Any) -> str:
     Returns:
         Generated markdown
     """
-    # Build example parameters
-    example_params = []
-    for param in tool_schema.parameters:
-        if param['required']:
-            example_value = _example_value(param['type'])
-            example_params.append(f"{param['name']}={example_value}")
+    return README_TEMPLATE.render(**_readme_context(tool_schema))
+
 
-    example_params_str = ", ".join(example_params) if example_params else ""
+def generate_readme_md_to(tool_schema: Any, fp: TextIO) -> None:
+    """
+    Stream README.md content from tool schema into an open file.
+
+    Args:
+        tool_schema: ToolSchema object
+        fp: Text file (or buffer) to write to
+    """
+    for chunk in README_TEMPLATE.generate(**_readme_context(tool_schema)):
+        fp.write(chunk)
+
+
+def _readme_context(tool_schema: Any) -> Dict[str, Any]:
+    """Build the README_TEMPLATE variables for a tool schema."""
+    # Build example parameters
+    example_params_str = ", ".join(
+        f"{param['name']}={_example_value(param['type'])}"
+        for param in tool_schema.parameters
+        if param['required']
+    )
 
     # Extract tags
     tags = [tool_schema.server, tool_schema.name]
 
-    return README_TEMPLATE.render(
+    return dict(
         server_name=tool_schema.server,
         tool_name=tool_schema.name,
         description=tool_schema.description,
@@ -182,26 +240,9 @@ def generate_init_py(description: str, server: str, tool_name: str) -> str:
 
 def _python_type_hint(json_type: str) -> str:
     """Convert JSON schema type to Python type hint."""
-    type_mapping = {
-        'string': 'str',
-        'number': 'float',
-        'integer': 'int',
-        'boolean': 'bool',
-        'array': 'list',
-        'object': 'dict',
-        'null': 'None',
-    }
-    return type_mapping.get(json_type, 'Any')
+    return _PY_TYPE_MAP.get(json_type, 'Any')
 
 
 def _example_value(json_type: str) -> str:
     """Generate example value for a type."""
-    examples = {
-        'string': '"example"',
-        'number': '0.0',
-        'integer': '0',
-        'boolean': 'True',
-        'array': '[]',
-        'object': '{}',
-    }
-    return examples.get(json_type, 'None')
+    return _EXAMPLE_MAP.get(json_type, 'None')
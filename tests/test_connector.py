@@ -9,6 +9,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch, Mock
 import asyncio
+from contextlib import asynccontextmanager
 
 from src.connector import MCPConnector, ToolSchema
 
@@ -230,6 +231,61 @@ class TestDisconnectAll:
             loop.close()
             asyncio.set_event_loop(None)
 
+    def test_connect_all_without_loop_thread_uses_private_loop(self):
+        """Test that connect_all() drives its own loop and disconnect closes it."""
+        connector = MCPConnector()
+
+        with patch.object(connector, "_async_open_connections", new=AsyncMock()):
+            connector.connect_all()
+
+        loop = connector._event_loop
+        assert loop is not None
+        assert not loop.is_closed()
+
+        connector.disconnect_all()
+
+        assert loop.is_closed()
+        assert connector._event_loop is None
+
+    @pytest.mark.asyncio
+    async def test_failed_handshake_cancels_pending_handshakes(self):
+        """Test that one failing initialize() doesn't leave siblings running."""
+        connector = MCPConnector()
+        connector.add_server("bad", "bad-server")
+        connector.add_server("slow", "slow-server")
+        slow_cancelled = asyncio.Event()
+
+        async def initialize_bad():
+            raise RuntimeError("handshake failed")
+
+        async def initialize_slow():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        @asynccontextmanager
+        async def fake_stdio_client(params):
+            yield params.command, None
+
+        @asynccontextmanager
+        async def fake_client_session(read_stream, write_stream):
+            session = MagicMock()
+            session.initialize = (
+                initialize_bad if read_stream == "bad-server" else initialize_slow
+            )
+            yield session
+
+        with patch("src.connector.stdio_client", fake_stdio_client), \
+                patch("src.connector.ClientSession", fake_client_session):
+            with pytest.raises(RuntimeError, match="handshake failed"):
+                await connector._async_connect_all()
+
+        assert slow_cancelled.is_set()
+        assert connector.connections == {}
+        await connector._async_disconnect_all()
+
 
 class TestIntrospectServer:
     """Test introspect_server() method."""
@@ -482,6 +538,33 @@ class TestGenerateApis:
                 assert (output_dir / "server1" / "tool" / "main.py").exists()
                 assert (output_dir / "server2" / "tool" / "main.py").exists()
 
+    def test_generate_apis_once_uses_cached_schemas(self):
+        """Test that a repeat generation skips connecting when schemas are cached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "servers"
+
+            connector = MCPConnector()
+            connector.add_server("test_server", "python server.py")
+            connector.connections["test_server"] = MagicMock()
+
+            with patch.object(connector, 'introspect_server') as mock_introspect:
+                mock_introspect.return_value = [ToolSchema("test_server", "tool1", "Tool 1", [])]
+                connector.generate_apis(output_dir)
+            connector.connections.clear()
+
+            with patch.object(connector, '_async_connect_all', new=AsyncMock()) as mock_connect:
+                connector.generate_apis_once(Path(tmpdir) / "again")
+
+                mock_connect.assert_not_called()
+                assert (Path(tmpdir) / "again" / "test_server" / "tool1" / "main.py").exists()
+
+            # A changed command invalidates the cache
+            connector.add_server("test_server", "python other_server.py")
+            with patch.object(connector, '_async_connect_all', new=AsyncMock()) as mock_connect:
+                connector.generate_apis_once(Path(tmpdir) / "changed")
+
+                mock_connect.assert_awaited_once()
+
 
 class TestGenerateApiFiles:
     """Test _generate_api_files() helper method."""
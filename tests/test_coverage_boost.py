@@ -45,6 +45,38 @@ class TestDatabaseUpdateAndDelete:
             assert skills[0]["category"] == "v2"  # Updated category
             assert skills[0]["code"] == "def v2(): pass"  # Updated code
 
+    @pytest.mark.asyncio
+    async def test_save_skills_bulk_upsert(self):
+        """Test that save_skills inserts new skills and updates existing ones."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "skills.db"
+            db = SkillsDatabase(db_path)
+            await db.initialize()
+
+            await db.save_skill(
+                agent_name="test-agent",
+                skill_name="existing",
+                category="v1",
+                code="def v1(): pass",
+            )
+            original = await db.get_skill("test-agent", "existing")
+
+            await db.save_skills("test-agent", [
+                {"name": "existing", "category": "v2", "code": "def v2(): pass"},
+                {
+                    "name": "new_skill",
+                    "category": "misc",
+                    "code": "def new(): pass",
+                    "dependencies": [{"server": "fs", "tool": "read"}],
+                },
+            ])
+
+            skills = {s["skill_name"]: s for s in await db.get_all_skills("test-agent")}
+            assert len(skills) == 2
+            assert skills["existing"]["category"] == "v2"
+            assert skills["existing"]["created_at"] == original["created_at"]
+            assert skills["new_skill"]["dependencies"] == [{"server": "fs", "tool": "read"}]
+
     @pytest.mark.asyncio
     async def test_delete_skill_success(self):
         """Test deleting an existing skill."""
@@ -411,6 +443,26 @@ class TestDatabaseAdditional:
             assert isinstance(skills[0]["metadata"], dict)
             assert skills[0]["metadata"] == {"version": "1.0", "author": "test"}
 
+    @pytest.mark.asyncio
+    async def test_iter_all_skills_streams_in_windows(self):
+        """Test that iter_all_skills yields every skill across fetch windows."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "skills.db"
+            db = SkillsDatabase(db_path)
+            await db.initialize()
+
+            await db.save_skills("test-agent", [
+                {"name": f"skill{i}", "category": "test", "code": "pass", "metadata": {"n": i}}
+                for i in range(5)
+            ])
+            await db.save_skill("other-agent", "skill0", "test", "pass")
+
+            skills = [skill async for skill in db.iter_all_skills("test-agent", batch_size=2)]
+
+            assert [s["skill_name"] for s in skills] == [f"skill{i}" for i in range(5)]
+            assert skills[3]["metadata"] == {"n": 3}
+            assert skills == await db.get_all_skills("test-agent")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
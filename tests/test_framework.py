@@ -68,6 +68,27 @@ class TestMCPApiInitialization:
             assert api.telemetry is not None
 
 
+    def test_api_passes_telemetry_pragmas(self):
+        """Test that telemetry_pragmas are applied to the telemetry database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            api = MCPApi(
+                agent_name="test-agent",
+                servers_dir=f"{tmpdir}/servers",
+                skills_dir=f"{tmpdir}/skills",
+                skills_db=f"{tmpdir}/skills.db",
+                telemetry_db=f"{tmpdir}/telemetry.db",
+                telemetry_pragmas={"synchronous": "OFF", "cache_size": -8000},
+            )
+
+            connection = api.telemetry.connection
+            synchronous = connection.execute("PRAGMA synchronous").fetchone()[0]
+            cache_size = connection.execute("PRAGMA cache_size").fetchone()[0]
+            api.telemetry.close()
+
+            assert synchronous == 0
+            assert cache_size == -8000
+
+
 class TestAddMCPServer:
     """Test add_mcp_server() method."""
 
@@ -147,6 +168,43 @@ class TestStartMethod:
                         mock_register.assert_called_once_with(mock_connections)
                         assert api._started is True
 
+    def test_generate_libraries_reuses_live_sessions_when_started(self):
+        """Test that generate_libraries() doesn't reconnect once started."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            api = MCPApi(
+                agent_name="test-agent",
+                servers_dir=f"{tmpdir}/servers",
+                skills_dir=f"{tmpdir}/skills",
+                skills_db=f"{tmpdir}/skills.db",
+                telemetry_db=None,
+            )
+            api._started = True
+
+            with patch.object(api.connector, "generate_apis") as mock_generate:
+                with patch.object(api.connector, "generate_apis_once") as mock_generate_once:
+                    api.generate_libraries()
+
+                    mock_generate.assert_called_once_with(output_dir=api.servers_dir)
+                    mock_generate_once.assert_not_called()
+
+    def test_generate_libraries_passes_refresh_through(self):
+        """Test that generate_libraries(refresh=True) skips cached schemas."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            api = MCPApi(
+                agent_name="test-agent",
+                servers_dir=f"{tmpdir}/servers",
+                skills_dir=f"{tmpdir}/skills",
+                skills_db=f"{tmpdir}/skills.db",
+                telemetry_db=None,
+            )
+
+            with patch.object(api.connector, "generate_apis_once") as mock_generate_once:
+                api.generate_libraries(refresh=True)
+
+            mock_generate_once.assert_called_once_with(
+                output_dir=api.servers_dir, refresh=True
+            )
+
 
 class TestSaveSkill:
     """Test save_skill() method."""
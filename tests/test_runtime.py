@@ -10,7 +10,7 @@ import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch
 from typing import Any, Dict
 
-from src.runtime import mcp_call, MCPRuntime, _runtime_instance
+from src.runtime import mcp_call, mcp_call_many, MCPRuntime, AsyncLoopThread
 
 
 class TestMCPCallGlobalFunction:
@@ -21,6 +21,7 @@ class TestMCPCallGlobalFunction:
         # Clear global instance
         import src.runtime as runtime_module
 
+        runtime_module._runtime_var.set(None)
         runtime_module._runtime_instance = None
 
         with pytest.raises(RuntimeError, match="MCP Runtime not initialized"):
@@ -35,6 +36,7 @@ class TestMCPCallGlobalFunction:
         # Set as global instance
         import src.runtime as runtime_module
 
+        runtime_module._runtime_var.set(mock_runtime)
         runtime_module._runtime_instance = mock_runtime
 
         # Call mcp_call
@@ -45,9 +47,41 @@ class TestMCPCallGlobalFunction:
         assert result == "test_result"
 
         # Cleanup
+        runtime_module._runtime_var.set(None)
         runtime_module._runtime_instance = None
 
 
+    def test_mcp_call_routes_to_runtime_of_its_context(self):
+        """Test that each context routes mcp_call() to the runtime it created."""
+        import contextvars
+        import threading
+
+        def make_runtime(name):
+            runtime = MCPRuntime()
+            runtime.call = MagicMock(return_value=name)
+            return runtime
+
+        context_a = contextvars.copy_context()
+        context_b = contextvars.copy_context()
+        context_a.run(make_runtime, "a")
+        context_b.run(make_runtime, "b")
+
+        try:
+            assert context_a.run(mcp_call, "s", "t", {}) == "a"
+            assert context_b.run(mcp_call, "s", "t", {}) == "b"
+
+            # A fresh thread has no context runtime and uses the latest one
+            results = []
+            thread = threading.Thread(target=lambda: results.append(mcp_call("s", "t", {})))
+            thread.start()
+            thread.join()
+            assert results == ["b"]
+        finally:
+            import src.runtime as runtime_module
+
+            runtime_module._runtime_instance = None
+
+
 class TestMCPRuntimeInitialization:
     """Test MCPRuntime initialization."""
 
@@ -64,15 +98,18 @@ class TestMCPRuntimeInitialization:
         import src.runtime as runtime_module
 
         # Clear global
+        runtime_module._runtime_var.set(None)
         runtime_module._runtime_instance = None
 
         # Create runtime
         runtime = MCPRuntime()
 
-        # Verify global instance is set
+        # Verify context and global instance are set
+        assert runtime_module._runtime_var.get() is runtime
         assert runtime_module._runtime_instance is runtime
 
         # Cleanup
+        runtime_module._runtime_var.set(None)
         runtime_module._runtime_instance = None
 
     def test_runtime_with_telemetry(self):
@@ -335,6 +372,72 @@ class TestAsyncCallResultExtraction:
         assert result == mock_content_item
 
 
+class TestAsyncLoopThread:
+    """Test the dedicated runtime event loop thread."""
+
+    def test_run_executes_on_loop_thread(self):
+        """Test that run() executes the coroutine on the loop thread."""
+        import threading
+
+        loop_thread = AsyncLoopThread()
+
+        async def current_thread_name():
+            return threading.current_thread().name
+
+        try:
+            assert loop_thread.run(current_thread_name()) == "mcp-runtime-loop"
+        finally:
+            loop_thread.stop()
+
+        assert loop_thread.loop.is_closed()
+
+    def test_custom_loop_factory(self):
+        """Test that an explicit loop factory overrides the default loop type."""
+        created = []
+
+        def factory():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        loop_thread = AsyncLoopThread(loop_factory=factory)
+        try:
+            assert loop_thread.loop is created[0]
+        finally:
+            loop_thread.stop()
+
+    def test_eager_task_factory_when_available(self):
+        """Test that the loop uses eager tasks on Python versions that have them."""
+        loop_thread = AsyncLoopThread()
+        try:
+            expected = getattr(asyncio, "eager_task_factory", None)
+            assert loop_thread.loop.get_task_factory() is expected
+        finally:
+            loop_thread.stop()
+
+    def test_call_from_thread_with_running_loop(self):
+        """Test that call() works from inside a running event loop."""
+        runtime = MCPRuntime()
+
+        mock_session = MagicMock()
+        mock_result = MagicMock()
+        mock_result.content = [MagicMock(text="from_loop_thread")]
+
+        async def mock_call_tool(tool, params):
+            return mock_result
+
+        mock_session.call_tool = mock_call_tool
+        runtime.register_servers({"test_server": mock_session})
+
+        async def agent_code():
+            return runtime.call("test_server", "test_tool", {})
+
+        try:
+            assert asyncio.run(agent_code()) == "from_loop_thread"
+        finally:
+            runtime.clear()
+
+
 class TestRuntimeClear:
     """Test runtime cleanup."""
 
@@ -391,6 +494,62 @@ class TestConcurrentCalls:
             loop.close()
             asyncio.set_event_loop(None)
 
+    def test_call_many_runs_concurrently_in_order(self):
+        """Test that call_many() overlaps calls and preserves input order."""
+        runtime = MCPRuntime()
+        mock_session = MagicMock()
+        in_flight = 0
+        peak = 0
+
+        async def mock_call_tool(tool, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            if tool == "fail":
+                raise Exception("tool failed")
+            result = MagicMock()
+            result.content = [MagicMock(text=f"{tool}:{params['n']}")]
+            return result
+
+        mock_session.call_tool = mock_call_tool
+
+        try:
+            runtime.register_servers({"test_server": mock_session})
+
+            results = runtime.call_many([
+                ("test_server", "a", {"n": 1}),
+                ("test_server", "fail", {"n": 2}),
+                ("test_server", "b", {"n": 3}),
+            ])
+
+            assert results[0] == "a:1"
+            assert isinstance(results[1], Exception)
+            assert results[2] == "b:3"
+            assert peak == 3
+        finally:
+            runtime.clear()
+
+    def test_call_many_with_unregistered_server_raises_error(self):
+        """Test that call_many() validates every server before dispatching."""
+        runtime = MCPRuntime()
+        runtime.servers = {"known": MagicMock()}
+
+        with pytest.raises(ValueError, match="Server 'unknown' not registered"):
+            runtime.call_many([("known", "tool", {}), ("unknown", "tool", {})])
+
+    def test_mcp_call_many_without_runtime_raises_error(self):
+        """Test that mcp_call_many() raises error when runtime not initialized."""
+        import src.runtime as runtime_module
+
+        runtime_module._runtime_var.set(None)
+        runtime_module._runtime_instance = None
+
+        with pytest.raises(RuntimeError, match="MCP Runtime not initialized"):
+            mcp_call_many([("test_server", "test_tool", {})])
+
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
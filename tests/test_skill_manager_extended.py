@@ -7,7 +7,9 @@ Tests additional edge cases, error handling, and untested paths in Skill Manager
 import pytest
 import tempfile
 import json
+import shutil
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from src import SkillManager, SkillsDatabase
 
@@ -82,6 +84,250 @@ class TestSkillManagerEdgeCases:
             assert len(cat1_skills) == 2
             assert all(s["category"] == "cat1" for s in cat1_skills)
 
+    def test_list_skills_with_fields(self):
+        """Test that list_skills can return only selected metadata keys."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            manager.save_skill("def s1(): pass", "skill1", "cat1", tags=["a"], persist_to_db=False)
+
+            skills = manager.list_skills(fields={"name", "path", "missing"})
+
+            assert skills == [{"name": "skill1", "path": "cat1/skill1"}]
+            assert manager.list_skills()[0]["tags"] == ["a"]
+
+    def test_list_skills_reads_many_skills_in_parallel(self):
+        """Test list_skills over enough skills to use the read pool."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            for i in range(20):
+                manager.save_skill(f"def s{i}(): pass", f"skill{i}", f"cat{i % 2}", persist_to_db=False)
+
+            # A corrupt metadata file is skipped, not fatal
+            (skills_dir / "cat0" / "skill0" / ".meta.json").write_text("{not json")
+
+            skills = manager.list_skills()
+            manager.close()
+
+            assert len(skills) == 19
+            assert {s["path"] for s in skills} == {
+                f"cat{i % 2}/skill{i}" for i in range(1, 20)
+            }
+            assert manager._io_pool is None
+
+    def test_list_skills_cache_invalidated_by_writes(self):
+        """Test that cached listings are refreshed when skills change."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            manager.save_skill("def s1(): pass", "skill1", "cat1", tags=["old"], persist_to_db=False)
+            first = manager.list_skills()
+            first[0]["tags"].append("mutated")
+
+            # Cached listing is not affected by caller mutation
+            assert manager.list_skills()[0]["tags"] == ["old"]
+
+            # Overwriting a skill doesn't change the category dir mtime
+            manager.save_skill("def s1(): pass", "skill1", "cat1", tags=["new"], persist_to_db=False)
+            assert manager.list_skills()[0]["tags"] == ["new"]
+            info = manager.get_skill_info("cat1", "skill1")
+            assert info["tags"] == ["new"]
+
+            # Nor is cached skill info
+            info["tags"].append("mutated")
+            assert manager.get_skill_info("cat1", "skill1")["tags"] == ["new"]
+
+            manager.save_skill("def s2(): pass", "skill2", "cat1", persist_to_db=False)
+            assert len(manager.list_skills(category="cat1")) == 2
+
+    def test_caches_see_rewrites_by_another_manager(self):
+        """Test that in-place rewrites from elsewhere aren't served stale."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+            other = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            manager.save_skill("def s1(): pass", "skill1", "cat1", tags=["old"], persist_to_db=False)
+            assert manager.list_skills()[0]["tags"] == ["old"]
+            assert manager.get_skill_info("cat1", "skill1")["code"] == "def s1(): pass"
+
+            other.save_skill("def s1(): pass", "skill1", "cat1", tags=["new", "x"], persist_to_db=False)
+            assert manager.list_skills()[0]["tags"] == ["new", "x"]
+
+            # Editing main.py alone leaves .meta.json untouched
+            (skills_dir / "cat1" / "skill1" / "main.py").write_text("def s1(): return 1")
+            assert manager.get_skill_info("cat1", "skill1")["code"] == "def s1(): return 1"
+
+    def test_save_skill_recreates_externally_removed_dir(self):
+        """Test that saving works after the skill dir is deleted elsewhere."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            manager.save_skill("def s1(): pass", "skill1", "cat1", persist_to_db=False)
+            shutil.rmtree(skills_dir / "cat1")
+
+            manager.save_skill("def s1(): return 1", "skill1", "cat1", persist_to_db=False)
+
+            assert (skills_dir / "cat1" / "skill1" / "main.py").read_text() == "def s1(): return 1"
+            assert [s["name"] for s in manager.list_skills()] == ["skill1"]
+
+    def test_category_dirs_rescanned_only_when_skills_dir_changes(self):
+        """Test that the category listing is cached until a category is added."""
+        import src.skill_manager as skill_manager_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            manager.save_skill("def s1(): pass", "skill1", "cat1", persist_to_db=False)
+            manager.list_skills()
+
+            with patch.object(
+                skill_manager_module, "_subdirs", wraps=skill_manager_module._subdirs
+            ) as mock_subdirs:
+                manager.list_skills()
+                manager.get_skill_categories()
+            assert manager.skills_dir not in [call.args[0] for call in mock_subdirs.call_args_list]
+
+            manager.save_skill("def s2(): pass", "skill2", "cat2", persist_to_db=False)
+            assert [c["name"] for c in manager.get_skill_categories()] == ["cat1", "cat2"]
+            assert len(manager.list_skills()) == 2
+
+    def test_metadata_round_trip_without_orjson(self):
+        """Test that .meta.json I/O works with the stdlib json fallback."""
+        import src.skill_manager as skill_manager_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            with patch.object(skill_manager_module, "orjson", None):
+                manager.save_skill("def s(): pass", "skill1", "cat1", tags=["über"], persist_to_db=False)
+                info = manager.get_skill_info("cat1", "skill1")
+
+            assert info["tags"] == ["über"]
+            assert manager.list_skills()[0]["tags"] == ["über"]
+
+    def test_get_skill_info_includes_readme_and_code(self):
+        """Test that get_skill_info returns metadata, README and code."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            code = '''"""Fetch users."""\ndef fetch(): pass\n'''
+            manager.save_skill(code, "fetch", "users", persist_to_db=False)
+            (skills_dir / "users" / "fetch" / "README.md").unlink()
+
+            info = manager.get_skill_info("users", "fetch")
+            assert manager._io_pool is None
+            manager.close()
+
+            assert info["name"] == "fetch"
+            assert info["code"] == code
+            assert "readme" not in info
+
+            with pytest.raises(ValueError, match="Skill not found"):
+                manager.get_skill_info("users", "missing")
+
+    def test_list_skills_reparses_only_changed_metadata(self):
+        """Test that rescanning a changed category reuses unchanged metadata."""
+        import src.skill_manager as skill_manager_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            for i in range(3):
+                manager.save_skill(f"def s{i}(): pass", f"skill{i}", "cat1", persist_to_db=False)
+            manager.list_skills()
+
+            manager.save_skill("def s3(): pass", "skill3", "cat1", persist_to_db=False)
+
+            with patch.object(
+                skill_manager_module, "_load_meta", wraps=skill_manager_module._load_meta
+            ) as mock_load:
+                skills = manager.list_skills()
+
+            assert len(skills) == 4
+            mock_load.assert_not_called()
+
+    def test_list_skills_uses_metadata_written_by_manager(self):
+        """Test that skills written by this manager are listed from the cache."""
+        import src.skill_manager as skill_manager_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            manager.save_skill("def a(): pass", "a", "cat1", tags=["x"], persist_to_db=False)
+            manager.save_skill("def b(): pass", "b", "cat2", persist_to_db=False)
+
+            with patch.object(
+                skill_manager_module, "_load_meta", wraps=skill_manager_module._load_meta
+            ) as mock_load:
+                skills = manager.list_skills()
+
+            mock_load.assert_not_called()
+            by_name = {skill["name"]: skill for skill in skills}
+            assert by_name["a"]["tags"] == ["x"]
+            assert by_name["a"]["path"] == str(Path("cat1") / "a")
+
+            # A fresh manager has no cache and reads the same metadata from disk
+            fresh = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+            assert sorted(fresh.list_skills(), key=lambda s: s["name"]) == sorted(
+                skills, key=lambda s: s["name"]
+            )
+            manager.close()
+            fresh.close()
+
     def test_dependency_extraction_with_no_mcp_calls(self):
         """Test dependency extraction when code has no mcp_call."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -206,12 +452,51 @@ def complex_task():
 
             await manager.hydrate_from_database()
 
-            # Old skill should be gone
+            # Old skill should be gone, including the moved-aside copy
             assert not (skills_dir / "old_category").exists()
+            assert list(Path(tmpdir).glob("skills.old.*")) == []
 
             # New skill should exist
             assert (skills_dir / "new_category" / "new_skill" / "main.py").exists()
 
+    @pytest.mark.asyncio
+    async def test_hydrate_many_skills_writes_all_files(self):
+        """Test that parallel hydration writes every file of every skill."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            db_path = Path(tmpdir) / "skills.db"
+
+            db = SkillsDatabase(db_path)
+            await db.initialize()
+            await db.save_skills("test-agent", [
+                {"name": f"skill{i}", "category": f"cat{i % 3}", "code": f'"""Skill {i} – ünïcode."""'}
+                for i in range(12)
+            ])
+
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=db_path,
+            )
+
+            count = await manager.hydrate_from_database()
+            manager.close()
+
+            assert count == 12
+            for i in range(12):
+                skill_dir = skills_dir / f"cat{i % 3}" / f"skill{i}"
+                assert (skill_dir / "main.py").read_text(encoding="utf-8") == f'"""Skill {i} – ünïcode."""'
+                assert f"Skill {i} – ünïcode." in (skill_dir / "README.md").read_text(encoding="utf-8")
+                assert json.loads((skill_dir / ".meta.json").read_text())["name"] == f"skill{i}"
+                assert (skill_dir / "__init__.py").exists()
+
+            # One timestamp is shared by the whole hydration batch
+            created = {
+                json.loads(meta_path.read_text())["created"]
+                for meta_path in skills_dir.glob("*/*/.meta.json")
+            }
+            assert len(created) == 1
+
     @pytest.mark.asyncio
     async def test_persist_to_database_async(self):
         """Test async persistence to database."""
@@ -246,6 +531,289 @@ def complex_task():
             assert skill["category"] == "test"
             assert skill["code"] == "def test(): pass"
 
+    @pytest.mark.asyncio
+    async def test_save_skill_persists_in_background(self):
+        """Test that queued skills reach the database after flush()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            db_path = Path(tmpdir) / "skills.db"
+
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=db_path,
+            )
+
+            for i in range(20):
+                manager.save_skill(f"def s{i}(): pass", f"skill{i}", "bulk")
+
+            manager.flush()
+            manager.close()
+
+            db = SkillsDatabase(db_path)
+            skills = await db.get_all_skills("test-agent")
+
+            assert len(skills) == 20
+            assert manager._persist_thread is None
+
+    @pytest.mark.asyncio
+    async def test_queued_skills_persisted_at_exit_without_close(self):
+        """Test that skills still queued at interpreter exit reach the database."""
+        import subprocess
+        import sys
+        import textwrap
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "skills.db"
+            script = textwrap.dedent(f"""
+                from pathlib import Path
+                from src import SkillManager
+
+                manager = SkillManager(
+                    skills_dir=Path({str(Path(tmpdir) / "skills")!r}),
+                    agent_name="test-agent",
+                    db_path=Path({str(db_path)!r}),
+                )
+                for i in range(50):
+                    manager.save_skill(f"def s{{i}}(): pass", f"skill{{i}}", "bulk")
+            """)
+            subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                cwd=Path(__file__).resolve().parent.parent,
+            )
+
+            skills = await SkillsDatabase(db_path).get_all_skills("test-agent")
+
+            assert len(skills) == 50
+
+    def test_dropped_manager_stops_persist_thread(self):
+        """Test that an unclosed manager's persist thread exits once collected."""
+        import gc
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+            manager.save_skill("def s(): pass", "skill1", "cat1")
+            thread = manager._persist_thread
+
+            del manager
+            gc.collect()
+            thread.join(timeout=5)
+
+            assert not thread.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_save_skills_batch(self):
+        """Test that save_skills writes, logs and persists every skill."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            db_path = Path(tmpdir) / "skills.db"
+            telemetry = MagicMock()
+
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=db_path,
+                telemetry=telemetry,
+            )
+
+            manager.save_skills([
+                {
+                    "code": f"def s{i}(): return mcp_call('fs', 'read', {{}})",
+                    "name": f"skill{i}",
+                    "category": "batch",
+                    "tags": ["t"],
+                }
+                for i in range(10)
+            ] + [{"code": "def g(): pass", "name": "plain"}])
+            manager.close()
+
+            assert (skills_dir / "general" / "plain" / "main.py").exists()
+            meta = json.loads((skills_dir / "batch" / "skill3" / ".meta.json").read_text())
+            assert meta["dependencies"] == [{"server": "fs", "tool": "read"}]
+            assert meta["tags"] == ["t"]
+
+            telemetry.log_skill_save_batch.assert_called_once()
+            assert len(telemetry.log_skill_save_batch.call_args[0][0]) == 11
+            telemetry.log_skill_save.assert_not_called()
+
+            db = SkillsDatabase(db_path)
+            assert len(await db.get_all_skills("test-agent")) == 11
+
+    @pytest.mark.asyncio
+    async def test_save_skills_duplicate_names_last_wins(self):
+        """Test that repeated (category, name) entries are written once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skills_dir = Path(tmpdir) / "skills"
+            db_path = Path(tmpdir) / "skills.db"
+
+            manager = SkillManager(
+                skills_dir=skills_dir,
+                agent_name="test-agent",
+                db_path=db_path,
+            )
+
+            manager.save_skills([
+                {"code": f"def dup():\n    return {i}\n" * 200, "name": "dup", "category": "c"}
+                for i in range(20)
+            ])
+            manager.close()
+
+            expected = "def dup():\n    return 19\n" * 200
+            assert (skills_dir / "c" / "dup" / "main.py").read_text() == expected
+
+            db = SkillsDatabase(db_path)
+            skills = await db.get_all_skills("test-agent")
+            assert len(skills) == 1
+            assert skills[0]["code"] == expected
+
+    def test_dependency_extraction_ignores_mcp_call_in_strings(self):
+        """Test that only real mcp_call() invocations count as dependencies."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            code = '''"""Reads a file."""
+HELP = "call mcp_call('fake', 'tool') to use"
+
+def run(api):
+    return api.mcp_call('filesystem', 'read_file', {})
+'''
+
+            docstring, dependencies = manager._analyze_code(code)
+
+            assert docstring == "Reads a file."
+            assert dependencies == [{"server": "filesystem", "tool": "read_file"}]
+
+    def test_extract_docstring_matches_ast(self):
+        """Test that docstring extraction agrees with ast.get_docstring."""
+        import ast
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            samples = [
+                '"""Sync files."""\ndef sync(): pass\n',
+                "# comment\n\n'''\n    Indented\n    docstring\n'''\nx = 1\n",
+                '"""doc"""  # trailing comment\nx = 1\n',
+                'x = 1\n"""not a docstring"""\n',
+                '"a" "b"\n',
+                '"a".join([])\n',
+                '(\n"""parenthesized"""\n)\n',
+                'b"bytes"\n',
+                'r"""Raw docstring."""\nx = 1\n',
+                'f"not a docstring"\n',
+                'def run(): pass\n',
+                'result = "value"\n',
+                "",
+            ]
+
+            for code in samples:
+                expected = ast.get_docstring(ast.parse(code)) or ""
+                assert manager._extract_docstring(code) == expected, code
+
+    def test_extract_docstring_skips_parsing_code_starting_with_a_name(self):
+        """Test that code opening with a statement keyword is not parsed."""
+        import src.skill_manager as skill_manager_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            with patch.object(skill_manager_module, "_analyze_source") as mock_analyze:
+                assert manager._extract_docstring("\nimport os\n") == ""
+                assert manager._extract_docstring("def run():\n    pass\n") == ""
+
+            mock_analyze.assert_not_called()
+
+    def test_unparseable_code_gets_same_docstring_when_saved_or_hydrated(self):
+        """Test that save and hydrate agree on the docstring of broken code."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            code = '"""Has doc."""\ndef broken(:\n'
+            saved_docstring, _ = manager._analyze_code(code)
+
+            assert manager._extract_docstring(code) == saved_docstring == ""
+
+    def test_extract_docstring_prefilter_agrees_with_analysis(self):
+        """Test that skipping the parse never changes the docstring."""
+        from src.skill_manager import _analyze_source
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            samples = [
+                'def broken(:\n"""Not reached."""\n',
+                'import os\n"""late"""\n',
+                'u"""Unicode docstring."""\n',
+                'rb"bytes"\n',
+                'Rb"""doc"""\ndef broken(:\n',
+                '  \n"""Indented start."""\n',
+                '# comment\n"""doc"""\ndef broken(:\n',
+                'x',
+            ]
+
+            for code in samples:
+                assert manager._extract_docstring(code) == _analyze_source(code)[0], code
+
+    def test_code_analysis_is_memoized(self):
+        """Test that analyzing identical code twice reuses the first parse."""
+        import src.skill_manager as skill_manager_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+            code = "def run():\n    return mcp_call('memo_server', 'memo_tool', {})\n"
+
+            _, first = manager._analyze_code(code)
+            first.append({"server": "mutated", "tool": "mutated"})
+            hits = skill_manager_module._analyze_source.cache_info().hits
+
+            _, second = manager._analyze_code(code)
+
+            assert skill_manager_module._analyze_source.cache_info().hits == hits + 1
+            assert second == [{"server": "memo_server", "tool": "memo_tool"}]
+
+    def test_dependency_extraction_falls_back_on_syntax_error(self):
+        """Test that unparseable code still yields regex-scanned dependencies."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SkillManager(
+                skills_dir=Path(tmpdir) / "skills",
+                agent_name="test-agent",
+                db_path=Path(tmpdir) / "skills.db",
+            )
+
+            docstring, dependencies = manager._analyze_code("mcp_call('github', 'list_users', {}\n")
+
+            assert docstring == ""
+            assert dependencies == [{"server": "github", "tool": "list_users"}]
+
     def test_create_skills_directory_if_not_exists(self):
         """Test that skills directory is created if it doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,588 @@
+"""
+Tests for TelemetryLogger - Event persistence and metrics queries.
+"""
+
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.telemetry import TelemetryLogger
+
+
+class TestBackgroundWriter:
+    """Test that events are written off the caller's thread."""
+
+    def test_metrics_include_queued_events(self):
+        """Test that query methods flush pending events before reading."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+
+            for _ in range(5):
+                telemetry.log_mcp_call(
+                    server="fs",
+                    tool="read_file",
+                    params={"path": "/tmp/x"},
+                    success=True,
+                    duration_ms=1.0,
+                    result="ok",
+                )
+
+            metrics = telemetry.get_tool_metrics()
+            telemetry.close()
+
+            assert len(metrics) == 1
+            assert metrics[0]["server"] == "fs"
+            assert metrics[0]["total_calls"] == 5
+
+    def test_close_writes_pending_events(self):
+        """Test that close() drains the queue before closing the connection."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+
+            telemetry.log_event(level="INFO", event_type="custom", data={"n": 1})
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            connection.close()
+
+            assert count == 1
+            assert not telemetry._writer.is_alive()
+
+    def test_queued_events_written_in_one_transaction(self):
+        """Test that events queued together are committed together."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+
+            commits = []
+            telemetry.connection.set_trace_callback(
+                lambda sql: commits.append(sql) if sql == "COMMIT" else None
+            )
+
+            # Hold the connection lock so events pile up behind the writer
+            with telemetry._lock:
+                for i in range(20):
+                    telemetry.log_event(level="INFO", event_type="custom", data={"n": i})
+
+            telemetry.flush()
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            connection.close()
+
+            assert count == 20
+            assert 1 <= len(commits) <= 2
+
+    def test_log_many_writes_all_events(self):
+        """Test that log_many queues a list of events as one batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+
+            telemetry.log_many([
+                {"level": "INFO", "event_type": "retry", "data": {"attempt": i},
+                 "success": i == 2}
+                for i in range(3)
+            ])
+            telemetry.log_many([])
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            rows = connection.execute(
+                "SELECT event_type, data, success FROM events ORDER BY id"
+            ).fetchall()
+            connection.close()
+
+            assert [json.loads(row[1])["attempt"] for row in rows] == [0, 1, 2]
+            assert [row[2] for row in rows] == [0, 0, 1]
+
+    def test_batch_holds_events_until_exit(self):
+        """Test that events logged in batch() are committed together on exit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+
+            commits = []
+            telemetry.connection.set_trace_callback(
+                lambda sql: commits.append(sql) if sql == "COMMIT" else None
+            )
+
+            with telemetry.batch():
+                telemetry.log_event(level="INFO", event_type="custom", data={"n": 0})
+                with telemetry.batch():
+                    telemetry.log_many([
+                        {"level": "INFO", "event_type": "custom", "data": {"n": i}}
+                        for i in range(1, 4)
+                    ])
+                telemetry.log_skill_save("cat", "skill", 1, [])
+
+                # Nothing reaches the writer before the outermost block exits
+                assert not telemetry._writer_state.pending
+
+            telemetry.flush()
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            connection.close()
+
+            assert count == 5
+            assert len(commits) == 1
+
+    def test_full_buffer_drops_oldest_events(self):
+        """Test that a backed-up writer evicts the oldest events and counts them."""
+        from unittest.mock import patch
+
+        import src.telemetry as telemetry_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+
+            with patch.object(telemetry_module, "_MAX_PENDING_EVENTS", 5):
+                telemetry = TelemetryLogger(db_path)
+
+                # Hold the connection lock so the writer can't drain the buffer
+                with telemetry._lock:
+                    telemetry.log_many([
+                        {"level": "INFO", "event_type": "custom", "data": {"n": i}}
+                        for i in range(12)
+                    ])
+
+                snapshot = telemetry.get_health_snapshot()
+                telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            written = [
+                json.loads(row[0])["n"]
+                for row in connection.execute("SELECT data FROM events ORDER BY id")
+            ]
+            connection.close()
+
+            assert snapshot["dropped_events"] == 7
+            assert written == [7, 8, 9, 10, 11]
+
+    def test_skill_save_batch_is_one_event(self):
+        """Test that a batch of skill saves is recorded as a single event."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+
+            telemetry.log_skill_save_batch([
+                {"category": "c", "name": f"s{i}", "code_lines": 1, "dependencies": []}
+                for i in range(3)
+            ])
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            rows = connection.execute("SELECT event_type, data FROM events").fetchall()
+            connection.close()
+
+            assert len(rows) == 1
+            assert rows[0][0] == "skill_save_batch"
+            assert json.loads(rows[0][1])["count"] == 3
+
+
+class TestEventQueries:
+    """Test reading raw events back."""
+
+    def test_get_events_filters_and_decodes(self):
+        """Test that get_events filters by type and decodes payloads."""
+        from unittest.mock import patch
+
+        import src.telemetry as telemetry_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+            for i in range(3):
+                telemetry.log_event(level="INFO", event_type="custom", data={"n": i})
+            telemetry.log_event(level="INFO", event_type="other", data={"n": 99})
+
+            events = telemetry.get_events(event_type="custom", hours=1, limit=2)
+            with patch.object(telemetry_module, "orjson", None):
+                fallback = telemetry.get_events(event_type="other")
+            telemetry.close()
+
+            assert [event["data"] for event in events] == [{"n": 2}, {"n": 1}]
+            assert events[0]["timestamp"].endswith("Z")
+            assert fallback[0]["data"] == {"n": 99}
+
+    def test_payloads_orjson_cannot_encode_fall_back_to_json(self):
+        """Test that huge ints and NaN/Infinity are stored as json.dumps would."""
+        import math
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+
+            telemetry.log_mcp_call(
+                server="s", tool="t", params={"id": 2**70}, success=True, duration_ms=1.0,
+            )
+            telemetry.log_mcp_call(
+                server="s", tool="t",
+                params={"nan": float("nan"), "inf": float("inf"), "none": None},
+                success=True, duration_ms=1.0,
+            )
+
+            events = telemetry.get_events(event_type="mcp_call")
+            telemetry.close()
+
+            params = [event["data"]["params"] for event in reversed(events)]
+            assert params[0] == {"id": 2**70}
+            assert math.isnan(params[1]["nan"])
+            assert params[1]["inf"] == float("inf")
+            assert params[1]["none"] is None
+
+
+class TestConnectionTuning:
+    """Test SQLite settings applied to the telemetry connection."""
+
+    def test_connection_uses_wal(self):
+        """Test that the database is opened in WAL mode with relaxed syncing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+
+            journal_mode = telemetry.connection.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = telemetry.connection.execute("PRAGMA synchronous").fetchone()[0]
+            telemetry.close()
+
+            assert journal_mode == "wal"
+            assert synchronous == 1  # NORMAL
+
+    def test_health_snapshot_uses_covering_index(self):
+        """Test that the health snapshot query is answered from an index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+
+            plan = telemetry.connection.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT event_type, COUNT(*), SUM(success), AVG(duration_ms)
+                FROM events
+                WHERE timestamp >= ?
+                    AND event_type IN ('mcp_call', 'code_execution', 'skill_execution')
+                GROUP BY event_type
+            """, (0,)).fetchall()
+            telemetry.close()
+
+            assert any("COVERING INDEX idx_health_cover" in row[3] for row in plan)
+
+    def test_error_patterns_use_partial_failure_index(self):
+        """Test that error pattern queries read only the failures index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+
+            plan = telemetry.connection.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT error_type, event_type, COUNT(*), MAX(timestamp)
+                FROM events
+                WHERE success = 0 AND error_type IS NOT NULL
+                GROUP BY error_type, event_type
+            """).fetchall()
+            indexes = {row[0] for row in telemetry.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            telemetry.close()
+
+            assert any("COVERING INDEX idx_failures" in row[3] for row in plan)
+            assert "idx_success" not in indexes
+
+    def test_invalid_pragma_rejected(self):
+        """Test that pragma names and values must be plain words or integers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="Invalid telemetry pragma"):
+                TelemetryLogger(
+                    Path(tmpdir) / "telemetry.db",
+                    pragmas={"synchronous": "OFF; DROP TABLE events"},
+                )
+
+    def test_close_is_idempotent(self):
+        """Test that closing twice doesn't raise."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+            telemetry.close()
+            telemetry.close()
+
+
+class TestPayloadEncoding:
+    """Test JSON encoding of event payloads."""
+
+    def test_payload_round_trips_with_and_without_orjson(self):
+        """Test that both encoders store payloads that decode to the same data."""
+        from unittest.mock import patch
+
+        import src.telemetry as telemetry_module
+
+        data = {"params": {"path": "/tmp/ü"}, "counts": {1: 2}, "ok": True}
+        expected = {"params": {"path": "/tmp/ü"}, "counts": {"1": 2}, "ok": True}
+
+        assert json.loads(telemetry_module._dump_data(data)) == expected
+        with patch.object(telemetry_module, "orjson", None):
+            assert json.loads(telemetry_module._dump_data(data)) == expected
+
+    def test_payloads_with_none_are_encoded_once(self):
+        """Test that null values don't send payloads through json.dumps."""
+        from unittest.mock import patch
+
+        import src.telemetry as telemetry_module
+
+        if telemetry_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        data = {"error": None, "params": {"limit": None}, "ratio": 0.5}
+        with patch.object(telemetry_module, "json") as mock_json:
+            encoded = telemetry_module._dump_data(data)
+
+        mock_json.dumps.assert_not_called()
+        assert json.loads(encoded) == data
+
+
+class TestTimestamps:
+    """Test integer timestamp storage and migration of older databases."""
+
+    def test_health_snapshot_window_and_iso_last_seen(self):
+        """Test that events are windowed by ns timestamp and reported as ISO."""
+        import time
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+            telemetry.log_mcp_call(
+                server="fs", tool="read", params={}, success=False,
+                duration_ms=2.0, error=ValueError("boom"),
+            )
+            telemetry.flush()
+
+            # An event from two days ago falls outside a 24h window
+            with telemetry._lock:
+                telemetry.connection.execute(
+                    "UPDATE events SET timestamp = ?",
+                    (time.time_ns() - 48 * 3600 * 1_000_000_000,),
+                )
+                telemetry.connection.commit()
+            telemetry.log_mcp_call(
+                server="fs", tool="read", params={}, success=True, duration_ms=1.0,
+            )
+
+            snapshot = telemetry.get_health_snapshot(hours=24)
+            patterns = telemetry.get_error_patterns()
+            telemetry.close()
+
+            assert snapshot["metrics"][0]["total"] == 1
+            assert patterns[0]["error_type"] == "ValueError"
+            assert patterns[0]["last_seen"].endswith("Z")
+            assert "T" in patterns[0]["last_seen"]
+
+    def test_text_timestamps_migrated_to_ns(self):
+        """Test that a database with ISO text timestamps is converted once."""
+        from datetime import datetime, timezone
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            connection = sqlite3.connect(str(db_path))
+            connection.execute("""
+                CREATE TABLE events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    server TEXT,
+                    tool TEXT,
+                    skill_category TEXT,
+                    skill_name TEXT,
+                    success INTEGER,
+                    duration_ms INTEGER,
+                    error_type TEXT
+                )
+            """)
+            connection.execute("CREATE INDEX idx_timestamp ON events(timestamp)")
+            connection.execute(
+                "INSERT INTO events (timestamp, level, event_type, data) VALUES (?, ?, ?, ?)",
+                ("2024-05-01T12:30:00.250000Z", "INFO", "custom", "{}"),
+            )
+            connection.commit()
+            connection.close()
+
+            telemetry = TelemetryLogger(db_path)
+            telemetry.log_event(level="INFO", event_type="custom", data={})
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            rows = connection.execute(
+                "SELECT timestamp, typeof(timestamp) FROM events ORDER BY id"
+            ).fetchall()
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            indexes = {row[0] for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'events'"
+            )}
+            connection.close()
+
+            expected = datetime(2024, 5, 1, 12, 30, 0, 250000, tzinfo=timezone.utc)
+            expected_ns = int(expected.timestamp() * 1000) * 1_000_000
+            assert rows[0] == (expected_ns, "integer")
+            assert rows[1][1] == "integer"
+            assert version >= 1
+            assert "idx_timestamp" in indexes
+
+    def test_autoincrement_dropped_and_ids_kept(self):
+        """Test that migration rebuilds the table without AUTOINCREMENT."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+            telemetry.log_event(level="INFO", event_type="custom", data={"n": 1})
+            telemetry.close()
+
+            # Recreate a version 1 table as the previous release left it
+            connection = sqlite3.connect(str(db_path))
+            connection.executescript("""
+                ALTER TABLE events RENAME TO events_new;
+                CREATE TABLE events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    level TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    server TEXT,
+                    tool TEXT,
+                    skill_category TEXT,
+                    skill_name TEXT,
+                    success INTEGER,
+                    duration_ms INTEGER,
+                    error_type TEXT
+                );
+                INSERT INTO events SELECT * FROM events_new;
+                DROP TABLE events_new;
+                PRAGMA user_version = 1;
+            """)
+            original = connection.execute("SELECT id, timestamp, data FROM events").fetchall()
+            connection.close()
+
+            telemetry = TelemetryLogger(db_path)
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            table_sql = connection.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+            ).fetchone()[0]
+            migrated = connection.execute("SELECT id, timestamp, data FROM events").fetchall()
+            connection.close()
+
+            assert "AUTOINCREMENT" not in table_sql
+            assert migrated == original
+
+
+class TestConsoleEcho:
+    """Test the console echo of logged events."""
+
+    def test_message_built_only_when_level_enabled(self, caplog):
+        """Test that disabled levels skip the echo and enabled ones log it."""
+        import logging
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            telemetry = TelemetryLogger(Path(tmpdir) / "telemetry.db")
+
+            with caplog.at_level(logging.WARNING, logger="src.telemetry"):
+                telemetry.log_mcp_call(
+                    server="fs", tool="read", params={}, success=True, duration_ms=3.0,
+                )
+                telemetry.log_mcp_call(
+                    server="fs", tool="write", params={}, success=False,
+                    duration_ms=4.0, error=OSError("denied"),
+                )
+            telemetry.close()
+
+            messages = [record.getMessage() for record in caplog.records]
+            assert not any("fs.read" in message for message in messages)
+            assert any("fs.write" in message and "OSError" in message for message in messages)
+
+
+class TestParamSummaries:
+    """Test that large MCP call params are summarized before logging."""
+
+    def test_large_params_truncated(self):
+        """Test that long strings, big containers and bytes are summarized."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+
+            telemetry.log_mcp_call(
+                server="fs",
+                tool="write_file",
+                params={
+                    "path": "/tmp/out.txt",
+                    "content": "x" * 10000,
+                    "lines": list(range(500)),
+                    "options": {"raw": b"\x00\x01", "mode": "w"},
+                },
+                success=True,
+                duration_ms=1.0,
+            )
+            telemetry.close()
+
+            connection = sqlite3.connect(str(db_path))
+            data = json.loads(connection.execute("SELECT data FROM events").fetchone()[0])
+            connection.close()
+
+            assert data["params"] == {
+                "path": "/tmp/out.txt",
+                "content": "<truncated 10000 chars>",
+                "lines": "<truncated list of 500 items>",
+                "options": {"raw": "<2 bytes>", "mode": "w"},
+            }
+
+
+class TestExitDrain:
+    """Test that buffered events survive interpreter exit without close()."""
+
+    def test_events_written_at_exit_without_close(self):
+        """Test that the atexit hook drains the writer before shutdown."""
+        import subprocess
+        import sys
+        import textwrap
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            script = textwrap.dedent(f"""
+                from pathlib import Path
+                from src.telemetry import TelemetryLogger
+
+                telemetry = TelemetryLogger(Path({str(db_path)!r}))
+                for i in range(5000):
+                    telemetry.log_event(level="DEBUG", event_type="custom", data={{"n": i}})
+            """)
+            subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                cwd=Path(__file__).resolve().parent.parent,
+            )
+
+            connection = sqlite3.connect(str(db_path))
+            count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            connection.close()
+
+            assert count == 5000
+
+    def test_dropped_logger_releases_writer_and_connection(self):
+        """Test that an unclosed logger stops its writer once collected."""
+        import gc
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+            telemetry.log_event(level="INFO", event_type="custom", data={"n": 1})
+            writer = telemetry._writer
+
+            del telemetry
+            gc.collect()
+            writer.join(timeout=5)
+
+            assert not writer.is_alive()
+
+            connection = sqlite3.connect(str(db_path))
+            count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            connection.close()
+
+            assert count == 1
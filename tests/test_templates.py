@@ -172,6 +172,22 @@ class TestMainPyGeneration:
             result = generate_main_py(schema)
             assert f"param: {python_type}" in result
 
+    def test_signature_defaults_use_repr(self):
+        """Test that defaults are rendered as Python literals."""
+        def schema_with_default(default):
+            return MockToolSchema(
+                name="fetch",
+                server="http",
+                description="HTTP fetch",
+                parameters=[
+                    {"name": "retry", "type": "integer", "required": False,
+                     "default": default, "description": "Retries"},
+                ],
+            )
+
+        assert "retry: int = 1" in generate_main_py(schema_with_default(1))
+        assert "retry: int = True" in generate_main_py(schema_with_default(True))
+
     def test_function_returns_any_type(self):
         """Test that functions return Any type by default."""
         schema = MockToolSchema(
@@ -184,6 +200,34 @@ class TestMainPyGeneration:
         assert "Any: Tool execution result" in result
 
 
+class TestStreamingGeneration:
+    """Test the file-streaming variants of the generators."""
+
+    def test_streamed_output_matches_rendered(self):
+        """Test that streaming to a file writes exactly what render returns."""
+        import io
+
+        from src.templates import generate_main_py_to, generate_readme_md_to
+
+        schema = MockToolSchema(
+            name="search",
+            server="github",
+            description="Search GitHub",
+            parameters=[
+                {"name": "query", "type": "string", "required": True, "description": "Search query"},
+                {"name": "limit", "type": "integer", "required": False, "description": "Result limit"},
+            ],
+        )
+
+        main_buffer = io.StringIO()
+        generate_main_py_to(schema, main_buffer)
+        readme_buffer = io.StringIO()
+        generate_readme_md_to(schema, readme_buffer)
+
+        assert main_buffer.getvalue() == generate_main_py(schema)
+        assert readme_buffer.getvalue() == generate_readme_md(schema)
+
+
 class TestReadmeGeneration:
     """Test README.md template generation."""
 